@@ -0,0 +1,45 @@
+"""
+TradeRisk Gunicorn Configuration
+==================================
+Production server settings for the Flask API.
+
+Usage (from backend/):
+    gunicorn -c gunicorn_conf.py "src.routes:create_app()"
+
+Requests are short, CPU-bound NumPy/Numba calls on in-memory data, so the
+server uses plain sync workers for real parallelism. The worker count
+defaults to 2×cores+1 and can be overridden via WEB_CONCURRENCY.
+Avoid gevent/eventlet: the numeric code runs in blocking C that cannot be
+monkey-patched, so one busy request would stall every greenlet in its worker.
+"""
+
+import gc
+import multiprocessing
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Same .env as app.py; loaded in the master so every worker inherits it
+load_dotenv(Path(__file__).parent / ".env")
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5001')}"
+
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+worker_class = "sync"
+threads = 1
+
+# Required: load data and build the engine once in the master so workers
+# share it copy-on-write after fork (the engine's arrays are read-only, so
+# those pages are never copied)
+preload_app = True
+
+timeout = 30
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    """Freeze the preloaded objects so the cyclic GC never touches (and copies) their pages."""
+    gc.freeze()
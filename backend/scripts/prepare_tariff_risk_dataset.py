@@ -11,10 +11,27 @@ Based on PRD v2 requirements.
 """
 
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pcsv
 import numpy as np
 import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Fall back to plain Python loops; results are identical, just slower
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
 # Configuration
 DATA_DIR = Path(__file__).parent.parent / "data"
 OUTPUT_DIR = DATA_DIR / "processed"
@@ -122,6 +139,30 @@ HS2_SECTOR_MAP = {
     '99': 'Special imports'
 }
 
+# Explicit CSV schemas (no dtype inference). country is dictionary-encoded at parse
+# time; value is read as text and cast leniently so unparsable cells become 0.
+EXPORT_SCHEMA = {
+    'year_month': pl.Int32,
+    'hs2': pl.Utf8,
+    'country': pl.Categorical,
+    'state': pl.Utf8,
+    'value': pl.Utf8,
+}
+IMPORT_SCHEMA = {
+    'year_month': pl.Int32,
+    'hs2': pl.Utf8,
+    'country': pl.Categorical,
+    'province': pl.Utf8,
+    'state': pl.Utf8,
+    'value': pl.Utf8,
+}
+
+# Columns the trade loaders actually use; state/province are never read
+TRADE_COLUMNS = ['year_month', 'hs2', 'country', 'value']
+
+# Sector name lookup keyed on the zero-padded HS2 code (unknown codes map to 'Other')
+SECTOR_NAME = pl.col('hs2').replace_strict(HS2_SECTOR_MAP, default='Other').alias('sector')
+
 # Country code mapping for key trading partners
 COUNTRY_NAMES = {
     'US': 'United States',
@@ -147,61 +188,167 @@ COUNTRY_NAMES = {
 }
 
 
-def load_export_data():
-    """Load and process export data at HS2 level."""
-    print("Loading export data...")
-    export_path = DATA_DIR / "2024_EXP_HS2" / "2024_EXP_HS2.csv"
-    
-    df = pd.read_csv(export_path)
-    df.columns = ['year_month', 'hs2', 'country', 'state', 'value']
+# Partners with a dedicated exposure_<code> column
+KEY_PARTNERS = ['US', 'CN', 'MX', 'JP', 'DE', 'GB']
+
+# Numeric sector-level columns that may be missing after the left merges
+NUMERIC_COLS = [
+    'export_value', 'import_value', 'trade_balance', 'total_trade', 'export_ratio',
+    'exposure_us', 'exposure_cn', 'exposure_mx', 'exposure_jp', 'exposure_de', 'exposure_gb',
+    'hhi_concentration', 'top_partner_share',
+]
+
+
+def country_names(codes):
+    """Map a categorical Series of country codes to display names (unknown codes pass through)."""
+    # Rename once per distinct category rather than looking up every row
+    return codes.cat.rename_categories(lambda c: COUNTRY_NAMES.get(c, c))
+
+
+def ordered_sum(expr):
+    """
+    Sum of expr within each group (or window), added up in row order.
+    
+    A plain .sum() aggregation combines per-thread partial sums in whatever
+    order they finish, so its last bits change from run to run and with the
+    thread count. Gathering each group's values first (row order within a
+    group is always preserved) and summing that list is reproducible, as
+    long as the input rows come in a fixed order: every group_by feeding
+    another aggregation therefore uses maintain_order=True.
+    """
+    return expr.implode().list.sum()
+
+
+def _is_fresh(cache_path, source_path, columns):
+    """
+    True if cache_path can stand in for source_path: it exists, is at least
+    as new, and holds every one of `columns`.
     
-    # Clean data
-    df['hs2'] = df['hs2'].astype(str).str.zfill(2)
-    df['value'] = pd.to_numeric(df['value'], errors='coerce').fillna(0)
+    A cache that cannot be read (e.g. left truncated by an older version)
+    counts as stale and is rebuilt.
+    """
+    if not cache_path.exists() or cache_path.stat().st_mtime < source_path.stat().st_mtime:
+        return False
+    try:
+        return set(columns) <= set(pl.read_parquet_schema(cache_path))
+    except (OSError, pl.exceptions.PolarsError):
+        return False
+
+
+def _write_cache(cache_path, write):
+    """
+    Call write(path) on a temporary file next to cache_path, then move it into place.
     
-    # Extract year and month
-    df['year'] = df['year_month'].astype(str).str[:4].astype(int)
-    df['month'] = df['year_month'].astype(str).str[4:6].astype(int)
+    The rename is atomic, so an interrupted or failed write never leaves a
+    partial cache behind that _is_fresh would accept.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def scan_csv_cached(csv_path, columns, **scan_kwargs):
+    """
+    Lazily scan a raw CSV through a Parquet cache stored next to it.
     
-    # Map sector names
-    df['sector'] = df['hs2'].map(HS2_SECTOR_MAP).fillna('Other')
+    Only `columns` are kept. On a cache miss (no cache, an older one, or one
+    missing some of `columns`) the CSV is parsed and written as Snappy
+    Parquet eagerly, at call time; otherwise nothing is read until the
+    returned LazyFrame is collected.
+    """
+    cache_path = csv_path.with_suffix('.parquet')
+    if not _is_fresh(cache_path, csv_path, columns):
+        query = pl.scan_csv(csv_path, **scan_kwargs).select(columns)
+        _write_cache(cache_path, lambda path: query.sink_parquet(path, compression='snappy'))
+    return pl.scan_parquet(cache_path).select(columns)
+
+
+def load_export_data():
+    """
+    Lazily load and process export data at HS2 level.
     
-    # Aggregate exports by HS2 and country (ignoring state)
-    exports_agg = df.groupby(['hs2', 'sector', 'country', 'year']).agg({
-        'value': 'sum'
-    }).reset_index()
-    exports_agg.rename(columns={'value': 'export_value'}, inplace=True)
+    Returns a Polars LazyFrame over the Parquet cache of the raw CSV (see
+    scan_csv_cached: a stale cache is rebuilt eagerly, when this is called).
+    """
+    print("Loading export data...")
+    export_path = DATA_DIR / "2024_EXP_HS2" / "2024_EXP_HS2.csv"
     
-    print(f"  Loaded {len(exports_agg)} export records")
-    return exports_agg
+    # Parse, clean, aggregate and map as one lazy Polars query
+    return (
+        scan_csv_cached(
+            export_path,
+            TRADE_COLUMNS,
+            has_header=False,
+            skip_rows=1,  # replace the source header with the schema names
+            schema=EXPORT_SCHEMA,
+        )
+        .with_columns(
+            pl.col('hs2').str.zfill(2),
+            # Dollar values stay Float64: float32 cannot hold sector totals in the billions exactly
+            pl.col('value').cast(pl.Float64, strict=False).fill_null(0),
+            # year_month is stored as an integer YYYYMM; year/month use the narrowest int types
+            (pl.col('year_month') // 100).cast(pl.Int16).alias('year'),
+            (pl.col('year_month') % 100).cast(pl.Int8).alias('month'),
+        )
+        # Aggregate exports by HS2 and country (ignoring state); like the pandas
+        # groupby this replaced, rows with an empty code or country are dropped
+        .drop_nulls(['hs2', 'country'])
+        .group_by(['hs2', 'country', 'year'], maintain_order=True)
+        .agg(ordered_sum(pl.col('value')).alias('export_value'))
+        # Map sector names once per aggregated row rather than per raw record
+        .with_columns(SECTOR_NAME)
+        .select(['hs2', 'sector', 'country', 'year', 'export_value'])
+    )
 
 
 def load_import_data():
-    """Load and process import data at HS2 level."""
+    """
+    Lazily load and process import data at HS2 level.
+    
+    Returns a Polars LazyFrame over the Parquet cache of the raw CSV (see
+    scan_csv_cached: a stale cache is rebuilt eagerly, when this is called).
+    """
     print("Loading import data...")
     import_path = DATA_DIR / "2024_IMP_HS2" / "2024_IMP_HS2.csv"
     
-    df = pd.read_csv(import_path)
-    df.columns = ['year_month', 'hs2', 'country', 'province', 'state', 'value']
-    
-    # Clean data
-    df['hs2'] = df['hs2'].astype(str).str.zfill(2)
-    df['value'] = pd.to_numeric(df['value'], errors='coerce').fillna(0)
-    
-    # Extract year
-    df['year'] = df['year_month'].astype(str).str[:4].astype(int)
-    
-    # Map sector names
-    df['sector'] = df['hs2'].map(HS2_SECTOR_MAP).fillna('Other')
-    
-    # Aggregate imports by HS2 and country (ignoring province/state)
-    imports_agg = df.groupby(['hs2', 'sector', 'country', 'year']).agg({
-        'value': 'sum'
-    }).reset_index()
-    imports_agg.rename(columns={'value': 'import_value'}, inplace=True)
-    
-    print(f"  Loaded {len(imports_agg)} import records")
-    return imports_agg
+    # Parse, clean, aggregate and map as one lazy Polars query
+    return (
+        scan_csv_cached(
+            import_path,
+            TRADE_COLUMNS,
+            has_header=False,
+            skip_rows=1,  # replace the source header with the schema names
+            schema=IMPORT_SCHEMA,
+        )
+        .with_columns(
+            pl.col('hs2').str.zfill(2),
+            pl.col('value').cast(pl.Float64, strict=False).fill_null(0),
+            (pl.col('year_month') // 100).cast(pl.Int16).alias('year'),
+        )
+        # Aggregate imports by HS2 and country (ignoring province/state); like the pandas
+        # groupby this replaced, rows with an empty code or country are dropped
+        .drop_nulls(['hs2', 'country'])
+        .group_by(['hs2', 'country', 'year'], maintain_order=True)
+        .agg(ordered_sum(pl.col('value')).alias('import_value'))
+        # Map sector names once per aggregated row rather than per raw record
+        .with_columns(SECTOR_NAME)
+        .select(['hs2', 'sector', 'country', 'year', 'import_value'])
+    )
+
+
+SUPPLIER_CHANGED_COL = (
+    'Business or organization changed suppliers as a result of tariffs imposed '
+    'by either Canada or the United States over the last three months'
+)
+
+NAICS_PATTERN = re.compile(r'^(?P<industry>.*?)(?:\s*\[(?P<naics_code>\d+(?:-\d+)?)\])?$')
+
+SUPPLIER_COLUMNS = ['GEO', 'Business characteristics', SUPPLIER_CHANGED_COL, 'VALUE']
 
 
 def load_supplier_change_data():
@@ -209,114 +356,175 @@ def load_supplier_change_data():
     print("Loading supplier change data...")
     supplier_path = DATA_DIR / "Business_Supplier_Change_Data.csv"
     
-    df = pd.read_csv(supplier_path)
-    
-    # Filter for "Yes" responses only (businesses that changed suppliers)
-    df_yes = df[df['Business or organization changed suppliers as a result of tariffs imposed by either Canada or the United States over the last three months'].str.contains('Yes', na=False)]
-    
-    # Extract NAICS code from business characteristics
-    df_yes = df_yes.copy()
-    df_yes['naics_code'] = df_yes['Business characteristics'].str.extract(r'\[(\d+(?:-\d+)?)\]')
-    df_yes['industry'] = df_yes['Business characteristics'].str.replace(r'\s*\[.*\]', '', regex=True)
-    
-    # Rename for clarity
-    supplier_data = df_yes[['GEO', 'industry', 'naics_code', 'VALUE']].copy()
-    supplier_data.columns = ['geography', 'industry', 'naics_code', 'pct_changed_suppliers']
-    supplier_data['pct_changed_suppliers'] = pd.to_numeric(supplier_data['pct_changed_suppliers'], errors='coerce')
+    cache_path = supplier_path.with_suffix('.parquet')
+    if _is_fresh(cache_path, supplier_path, SUPPLIER_COLUMNS):
+        df = pd.read_parquet(cache_path, engine='pyarrow', columns=SUPPLIER_COLUMNS)
+    else:
+        df = pd.read_csv(supplier_path, engine='pyarrow', usecols=SUPPLIER_COLUMNS)
+        _write_cache(cache_path, lambda path: df.to_parquet(
+            path, engine='pyarrow', compression='snappy', index=False
+        ))
+    
+    df = df.rename(columns={SUPPLIER_CHANGED_COL: 'changed'})
+    
+    # Filter for "Yes" responses only (businesses that changed suppliers).
+    # The response column is a small closed set, so match on the categories
+    # once and filter rows by integer code.
+    changed = df['changed'].astype('category')
+    yes_codes = np.flatnonzero(changed.cat.categories.str.contains('Yes', regex=False))
+    df_yes = df.loc[np.isin(changed.cat.codes, yes_codes), ['GEO', 'Business characteristics', 'VALUE']]
+    
+    # Split business characteristics into industry name and NAICS code in one
+    # regex pass; rows without a bracketed code keep their full label
+    parsed = df_yes['Business characteristics'].str.extract(NAICS_PATTERN)
+    
+    # Build the output frame directly with clear column names
+    supplier_data = pd.DataFrame({
+        'geography': df_yes['GEO'],
+        'industry': parsed['industry'],
+        'naics_code': parsed['naics_code'],
+        'pct_changed_suppliers': pd.to_numeric(df_yes['VALUE'], errors='coerce'),
+    })
     
     print(f"  Loaded {len(supplier_data)} supplier change records")
     return supplier_data
 
 
-def calculate_sector_metrics(exports_df, imports_df):
-    """Calculate sector-level trade metrics."""
+def calculate_sector_metrics(exports, imports):
+    """Calculate sector-level trade metrics (lazy)."""
     print("Calculating sector metrics...")
     
     # Aggregate by sector
-    sector_exports = exports_df.groupby(['hs2', 'sector']).agg({
-        'export_value': 'sum'
-    }).reset_index()
-    
-    sector_imports = imports_df.groupby(['hs2', 'sector']).agg({
-        'import_value': 'sum'
-    }).reset_index()
-    
-    # Merge exports and imports
-    sector_trade = sector_exports.merge(sector_imports, on=['hs2', 'sector'], how='outer').fillna(0)
-    
-    # Calculate trade balance
-    sector_trade['trade_balance'] = sector_trade['export_value'] - sector_trade['import_value']
-    sector_trade['total_trade'] = sector_trade['export_value'] + sector_trade['import_value']
-    
-    # Calculate export/import ratio
-    sector_trade['export_ratio'] = sector_trade['export_value'] / (sector_trade['total_trade'] + 1)
-    
-    print(f"  Calculated metrics for {len(sector_trade)} sectors")
-    return sector_trade
+    sector_exports = (
+        exports.group_by(['hs2', 'sector'], maintain_order=True)
+        .agg(ordered_sum(pl.col('export_value')))
+    )
+    sector_imports = (
+        imports.group_by(['hs2', 'sector'], maintain_order=True)
+        .agg(ordered_sum(pl.col('import_value')))
+    )
+    
+    # Merge exports and imports, then derive balance, total and export/import ratio
+    return (
+        sector_exports.join(sector_imports, on=['hs2', 'sector'], how='full', coalesce=True)
+        .with_columns(pl.col(['export_value', 'import_value']).fill_null(0.0))
+        .with_columns(
+            (pl.col('export_value') - pl.col('import_value')).alias('trade_balance'),
+            (pl.col('export_value') + pl.col('import_value')).alias('total_trade'),
+        )
+        .with_columns((pl.col('export_value') / (pl.col('total_trade') + 1)).alias('export_ratio'))
+    )
 
 
-def calculate_partner_exposure(exports_df):
-    """Calculate exposure to trading partners for each sector."""
-    print("Calculating partner exposure...")
-    
-    # Total exports by sector
-    sector_totals = exports_df.groupby(['hs2', 'sector'])['export_value'].sum().reset_index()
-    sector_totals.rename(columns={'export_value': 'total_sector_exports'}, inplace=True)
-    
-    # Exports by sector and country
-    partner_exports = exports_df.groupby(['hs2', 'sector', 'country'])['export_value'].sum().reset_index()
-    
-    # Merge to calculate exposure percentages
-    partner_exposure = partner_exports.merge(sector_totals, on=['hs2', 'sector'])
-    partner_exposure['partner_share'] = partner_exposure['export_value'] / (partner_exposure['total_sector_exports'] + 1)
-    
-    # Pivot to get exposure to key partners
-    key_partners = ['US', 'CN', 'MX', 'JP', 'DE', 'GB']
-    
-    exposure_wide = partner_exposure[partner_exposure['country'].isin(key_partners)].pivot_table(
-        index=['hs2', 'sector'],
-        columns='country',
-        values='partner_share',
-        aggfunc='sum'
-    ).reset_index().fillna(0)
-    
-    # Rename columns
-    exposure_wide.columns = ['hs2', 'sector'] + [f'exposure_{c.lower()}' for c in exposure_wide.columns[2:]]
+def compute_partner_metrics(exports):
+    """
+    Aggregate exports by sector and partner in a single pass (lazy).
     
-    print(f"  Calculated partner exposure for {len(exposure_wide)} sector-partner pairs")
-    return exposure_wide
+    Returns one row per (hs2, sector, country) with the partner's export
+    value and its share of the sector's total exports. Partner exposure
+    and concentration are both derived from this frame.
+    """
+    print("Calculating partner metrics...")
+    
+    # Exports by sector and country, with the sector total as a window
+    # expression so no separate totals frame is built or joined back
+    return (
+        exports.group_by(['hs2', 'sector', 'country'], maintain_order=True)
+        .agg(ordered_sum(pl.col('export_value')))
+        .with_columns(
+            (pl.col('export_value') / (ordered_sum(pl.col('export_value')).over(['hs2', 'sector']) + 1))
+            .alias('partner_share')
+        )
+    )
 
 
-def calculate_concentration(exports_df):
-    """Calculate export concentration (Herfindahl-Hirschman Index)."""
-    print("Calculating export concentration...")
-    
-    # Total exports by sector
-    sector_totals = exports_df.groupby(['hs2', 'sector'])['export_value'].sum().reset_index()
-    sector_totals.rename(columns={'export_value': 'total_sector_exports'}, inplace=True)
-    
-    # Exports by sector and country
-    partner_exports = exports_df.groupby(['hs2', 'sector', 'country'])['export_value'].sum().reset_index()
-    
-    # Merge
-    partner_exports = partner_exports.merge(sector_totals, on=['hs2', 'sector'])
-    partner_exports['partner_share'] = partner_exports['export_value'] / (partner_exports['total_sector_exports'] + 1)
+def partner_exposure_aggs():
+    """
+    Polars aggregation expressions for exposure to each key trading partner.
     
-    # Calculate HHI (sum of squared shares)
-    partner_exports['share_squared'] = partner_exports['partner_share'] ** 2
-    concentration = partner_exports.groupby(['hs2', 'sector'])['share_squared'].sum().reset_index()
-    concentration.rename(columns={'share_squared': 'hhi_concentration'}, inplace=True)
+    Returns one expression per KEY_PARTNERS entry, for use in a
+    group_by(['hs2', 'sector']).agg() over compute_partner_metrics().
+    """
+    # One conditional sum per key partner instead of a pivot (each sector has
+    # at most one row per country, so these sums are exact in any order)
+    share = pl.col('partner_share')
+    return [
+        share.filter(pl.col('country') == c).sum().alias(f'exposure_{c.lower()}')
+        for c in KEY_PARTNERS
+    ]
+
+
+def concentration_aggs():
+    """
+    Polars aggregation expressions for export concentration (Herfindahl-Hirschman
+    Index), top partner and top partner share.
     
-    # Get top partner for each sector
-    top_partners = partner_exports.loc[partner_exports.groupby(['hs2', 'sector'])['partner_share'].idxmax()]
-    top_partners = top_partners[['hs2', 'sector', 'country', 'partner_share']].copy()
-    top_partners.columns = ['hs2', 'sector', 'top_partner', 'top_partner_share']
+    Like partner_exposure_aggs(), these only describe the per-sector
+    aggregation; nothing is computed until the query is collected.
+    """
+    share = pl.col('partner_share')
+    return [
+        # HHI (sum of squared shares)
+        ordered_sum(share ** 2).alias('hhi_concentration'),
+        # Top partner for each sector; ties go to the first country by name
+        pl.col('country').sort_by([share, pl.col('country').cast(pl.Utf8)], descending=[True, False])
+        .first().cast(pl.Utf8).alias('top_partner'),
+        share.max().alias('top_partner_share'),
+    ]
+
+
+# No fastmath: hhi_max is 0 when no sector has partner data, and 0/0 must give
+# NaN exactly as in the plain-Python fallback (fastmath leaves it undefined)
+@njit(
+    'void(float64[:], float64[:], float64[:], float64, float64, float64[:], float64[:], float64, '
+    'float64, float64, float64, float64[:], float64[:], float64[:], float64[:])',
+    parallel=True, cache=True, error_model='numpy'
+)
+def _score_kernel(us_exp, hhi, top, us_max, hhi_max, export_val, exposure_target, tariff_pct,
+                  w1, w2, w3, out_risk, out_shock, out_delta, out_affected):
+    """
+    Fused per-sector risk score and tariff shock.
     
-    # Merge
-    concentration = concentration.merge(top_partners, on=['hs2', 'sector'])
+    Baseline risk = (us_exp / us_max * w1 + hhi / hhi_max * w2 + top * w3) * 100,
+    clipped to [0, 100]; the scenario scales it by (1 + exposure_target * tariff_pct / 100),
+    and affected exports are export_val * exposure_target * tariff_pct / 100.
+    """
+    shock = tariff_pct / 100
+    for i in prange(us_exp.shape[0]):
+        risk = (us_exp[i] / us_max * w1 + hhi[i] / hhi_max * w2 + top[i] * w3) * 100
+        risk = min(max(risk, 0.0), 100.0)
+        shocked = risk * (1 + exposure_target[i] * shock)
+        out_risk[i] = risk
+        out_delta[i] = shocked - risk
+        out_shock[i] = min(max(shocked, 0.0), 100.0)
+        out_affected[i] = export_val[i] * exposure_target[i] * shock
+
+
+def _float_column(sector_data, name, default):
+    """A sector column as a writable float64 array, or `default` everywhere if it is missing."""
+    if name in sector_data.columns:
+        # Writable contiguous copy to match the kernel's pinned float64[:] signature
+        return sector_data[name].to_numpy(dtype=np.float64, copy=True)
+    return np.full(len(sector_data), default)
+
+
+def _score_inputs(sector_data):
+    """
+    The _score_kernel inputs that do not depend on the scenario.
     
-    print(f"  Calculated concentration for {len(concentration)} sectors")
-    return concentration
+    Returns (us_exp, hhi, top, us_max, hhi_max, export_val), in kernel
+    argument order.
+    """
+    # Default US exposure if no data
+    us_exp = _float_column(sector_data, 'exposure_us', 0.5)
+    hhi = _float_column(sector_data, 'hhi_concentration', 0.0)
+    # One scan for both normalisers (us_max is unused when the column is missing)
+    maxes = sector_data[[c for c in ('exposure_us', 'hhi_concentration') if c in sector_data.columns]].max()
+    us_max = maxes.get('exposure_us', 1.0)
+    hhi_max = maxes.get('hhi_concentration', 0.0)
+    top = _float_column(sector_data, 'top_partner_share', 0.0)
+    export_val = _float_column(sector_data, 'export_value', 0.0)
+    return us_exp, hhi, top, us_max, hhi_max, export_val
 
 
 def calculate_risk_score(sector_data, w_exposure=0.4, w_concentration=0.3, w_us_dependency=0.3):
@@ -325,38 +533,68 @@ def calculate_risk_score(sector_data, w_exposure=0.4, w_concentration=0.3, w_us_
     Risk = (Exposure × w1 + Concentration × w2) × Shock
     
     For baseline, we use US exposure as proxy for tariff shock risk.
+    Runs _score_kernel with no tariff, so the formula lives in one place.
     """
     print("Calculating risk scores...")
     
-    df = sector_data.copy()
+    n = len(sector_data)
+    out = np.empty((4, n))
+    _score_kernel(
+        *_score_inputs(sector_data), np.zeros(n), 0.0,
+        w_exposure, w_concentration, w_us_dependency, *out
+    )
     
-    # Normalize exposure to US (0-1)
-    if 'exposure_us' in df.columns:
-        df['us_exposure_norm'] = df['exposure_us'] / df['exposure_us'].max()
-    else:
-        df['us_exposure_norm'] = 0.5  # Default if no US exposure data
-    
-    # Normalize HHI (already 0-1)
-    df['hhi_norm'] = df['hhi_concentration'] / df['hhi_concentration'].max()
-    
-    # Normalize top partner share
-    df['top_partner_norm'] = df['top_partner_share']
-    
-    # Calculate base risk score (0-100)
-    df['risk_score'] = (
-        (df['us_exposure_norm'] * w_exposure +
-         df['hhi_norm'] * w_concentration +
-         df['top_partner_norm'] * w_us_dependency)
-    ) * 100
-    
-    # Clip to 0-100
-    df['risk_score'] = df['risk_score'].clip(0, 100)
+    # assign() shares the existing columns instead of copying them
+    df = sector_data.assign(risk_score=out[0])
     
     print(f"  Calculated risk scores for {len(df)} sectors")
     return df
 
 
-def simulate_tariff_scenario(sector_data, tariff_pct=10, target_partner='US'):
+def simulate_tariff_scenarios(sector_data, tariff_pcts, target_partners,
+                              w_exposure=0.4, w_concentration=0.3, w_us_dependency=0.3):
+    """
+    Simulate a grid of tariff scenarios in one call.
+    
+    Parameters:
+    - tariff_pcts: Tariff increase percentages (0-25%)
+    - target_partners: Target trading partner codes
+    
+    Returns a long-format frame indexed by (sector row, target_partner, tariff_pct)
+    with shocked_risk_score, risk_delta and affected_export_value. The
+    scenario-independent inputs are prepared once; each scenario is then one
+    _score_kernel pass.
+    """
+    tariff_pcts = np.atleast_1d(np.asarray(tariff_pcts, dtype=np.float64))
+    target_partners = list(target_partners)
+    inputs = _score_inputs(sector_data)
+    
+    # (partners x tariffs x outputs x sectors): each scenario writes one contiguous block
+    out = np.empty((len(target_partners), len(tariff_pcts), 4, len(sector_data)))
+    for j, partner in enumerate(target_partners):
+        # A missing partner column means no exposure
+        exposure_target = _float_column(sector_data, f'exposure_{partner.lower()}', 0.0)
+        for k, tariff_pct in enumerate(tariff_pcts.tolist()):
+            _score_kernel(
+                *inputs, exposure_target, tariff_pct,
+                w_exposure, w_concentration, w_us_dependency, *out[j, k]
+            )
+    
+    # (outputs x sectors x partners x tariffs), matching the index order
+    out = out.transpose(2, 3, 0, 1)
+    index = pd.MultiIndex.from_product(
+        [sector_data.index, target_partners, tariff_pcts],
+        names=[sector_data.index.name, 'target_partner', 'tariff_pct'],
+    )
+    return pd.DataFrame({
+        'shocked_risk_score': out[1].ravel(),
+        'risk_delta': out[2].ravel(),
+        'affected_export_value': out[3].ravel(),
+    }, index=index)
+
+
+def simulate_tariff_scenario(sector_data, tariff_pct=10, target_partner='US',
+                             w_exposure=0.4, w_concentration=0.3, w_us_dependency=0.3):
     """
     Simulate the impact of a tariff increase on risk scores.
     
@@ -364,57 +602,84 @@ def simulate_tariff_scenario(sector_data, tariff_pct=10, target_partner='US'):
     - tariff_pct: Tariff increase percentage (0-25%)
     - target_partner: Target trading partner
     """
-    df = sector_data.copy()
+    scenario = simulate_tariff_scenarios(
+        sector_data, [tariff_pct], [target_partner],
+        w_exposure, w_concentration, w_us_dependency
+    )
     
-    # Shock multiplier based on tariff percentage
-    shock_multiplier = 1 + (tariff_pct / 100)
+    # A single scenario has exactly one row per sector, in sector order
+    return sector_data.assign(**{col: scenario[col].to_numpy() for col in scenario.columns})
+
+
+def score_sectors(sector_data, tariff_pct=10, target_partner='US',
+                  w_exposure=0.4, w_concentration=0.3, w_us_dependency=0.3):
+    """
+    Compute baseline risk and the tariff scenario columns in one pass.
     
-    # Partner exposure column
-    exposure_col = f'exposure_{target_partner.lower()}'
+    US exposure and HHI are normalised by their column maxima; both formulas
+    run in a single compiled loop over raw arrays (_score_kernel). Adds
+    risk_score, shocked_risk_score, risk_delta and affected_export_value.
+    """
+    print("Calculating risk scores...")
     
-    if exposure_col in df.columns:
-        # Calculate shocked risk score
-        df['shocked_risk_score'] = df['risk_score'] * (1 + df[exposure_col] * (shock_multiplier - 1))
-        df['risk_delta'] = df['shocked_risk_score'] - df['risk_score']
-        df['affected_export_value'] = df['export_value'] * df[exposure_col] * (tariff_pct / 100)
-    else:
-        df['shocked_risk_score'] = df['risk_score']
-        df['risk_delta'] = 0
-        df['affected_export_value'] = 0
+    # A missing partner column means no exposure
+    exposure_target = _float_column(sector_data, f'exposure_{target_partner.lower()}', 0.0)
+    
+    out = np.empty((4, len(sector_data)))
+    _score_kernel(
+        *_score_inputs(sector_data), exposure_target, float(tariff_pct),
+        w_exposure, w_concentration, w_us_dependency, *out
+    )
     
-    # Clip shocked scores
-    df['shocked_risk_score'] = df['shocked_risk_score'].clip(0, 100)
+    # assign() returns a new frame that shares the input columns rather than copying them
+    df = sector_data.assign(
+        risk_score=out[0],
+        shocked_risk_score=out[1],
+        risk_delta=out[2],
+        affected_export_value=out[3],
+    )
     
+    print(f"  Calculated risk scores for {len(df)} sectors")
     return df
 
 
-def create_final_dataset(exports_df, imports_df, supplier_df):
+def create_final_dataset(exports, imports):
     """Create the final unified dataset for TariffShock."""
     print("\nCreating final dataset...")
     
-    # Calculate all metrics
-    sector_trade = calculate_sector_metrics(exports_df, imports_df)
-    partner_exposure = calculate_partner_exposure(exports_df)
-    concentration = calculate_concentration(exports_df)
-    
-    # Merge all sector-level data
-    final_df = sector_trade.merge(partner_exposure, on=['hs2', 'sector'], how='left')
-    final_df = final_df.merge(concentration, on=['hs2', 'sector'], how='left')
-    
-    # Fill NaN values
-    final_df = final_df.fillna(0)
-    
-    # Calculate risk scores
-    final_df = calculate_risk_score(final_df)
+    # Describe all metrics as one lazy query. Exposure and concentration are
+    # aggregated in the same group_by, so the partner rows are hashed on
+    # (hs2, sector) once and joined back once.
+    sector_trade = calculate_sector_metrics(exports, imports)
+    partner_metrics = (
+        compute_partner_metrics(exports)
+        .group_by(['hs2', 'sector'], maintain_order=True)
+        .agg(*partner_exposure_aggs(), *concentration_aggs())
+    )
+    
+    # Merge all sector-level data and materialize once
+    final_df = (
+        sector_trade.join(partner_metrics, on=['hs2', 'sector'], how='left')
+        # Sectors with no partner rows get zero exposure/concentration and
+        # an explicit 'NONE' top partner
+        .with_columns(
+            pl.col(NUMERIC_COLS).fill_null(0.0),
+            pl.col('top_partner').fill_null('NONE').cast(pl.Categorical),
+        )
+        # Fixed row order (hs2), which the stable risk-score sort below keeps for ties
+        .sort('hs2')
+        .collect(engine='streaming')
+        .to_pandas()
+    )
+    
+    # Calculate risk scores and scenario simulation columns (baseline = 10% US tariff)
+    final_df = score_sectors(final_df, tariff_pct=10, target_partner='US')
     
     # Add tariff_percent column for ML training (baseline scenario = 10%)
     final_df['tariff_percent'] = 10.0
     
-    # Add scenario simulation columns (baseline = 10% US tariff)
-    final_df = simulate_tariff_scenario(final_df, tariff_pct=10, target_partner='US')
-    
     # Map top partner names
-    final_df['top_partner_name'] = final_df['top_partner'].map(COUNTRY_NAMES).fillna(final_df['top_partner'])
+    final_df['top_partner_name'] = country_names(final_df['top_partner'])
     
     # Reorder columns for clarity
     column_order = [
@@ -429,13 +694,33 @@ def create_final_dataset(exports_df, imports_df, supplier_df):
     final_columns = [c for c in column_order if c in final_df.columns]
     final_df = final_df[final_columns]
     
-    # Sort by risk score
-    final_df = final_df.sort_values('risk_score', ascending=False).reset_index(drop=True)
+    # Sort by risk score; the stable sort keeps equal scores in hs2 order
+    final_df = final_df.sort_values('risk_score', ascending=False, kind='stable').reset_index(drop=True)
     
     print(f"  Final dataset has {len(final_df)} sectors and {len(final_df.columns)} features")
     return final_df
 
 
+def build_partner_trade_data(exports):
+    """Export totals per sector and partner country, for visualizations."""
+    partner_exports = (
+        exports.group_by(['hs2', 'sector', 'country'], maintain_order=True)
+        .agg(ordered_sum(pl.col('export_value')))
+        # Sort on the labels (not category codes) to keep the written file stable
+        .sort(pl.col('hs2'), pl.col('country').cast(pl.Utf8))
+        .with_columns(pl.col('country').cast(pl.Categorical))
+        .collect(engine='streaming')
+        .to_pandas()
+    )
+    partner_exports['country_name'] = country_names(partner_exports['country'])
+    return partner_exports
+
+
+def write_csv(df, path):
+    """Write a DataFrame to CSV with the multi-threaded PyArrow writer."""
+    pcsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
+
 def main():
     """Main execution function."""
     print("=" * 60)
@@ -445,34 +730,39 @@ def main():
     # Create output directory
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Load data
-    exports_df = load_export_data()
-    imports_df = load_import_data()
-    supplier_df = load_supplier_change_data()
-    
-    # Create final dataset
-    final_df = create_final_dataset(exports_df, imports_df, supplier_df)
+    # Load data (trade files are lazy and only read when collected)
+    exports = load_export_data()
+    imports = load_import_data()
+    
+    # The three outputs are independent: parse the supplier CSV and run the
+    # partner query on worker threads while the sector query runs here.
+    # PyArrow and Polars do their work outside the GIL, so threads overlap
+    # without pickling frames across processes.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        supplier_future = pool.submit(load_supplier_change_data)
+        partner_future = pool.submit(build_partner_trade_data, exports)
+        
+        # Create final dataset
+        final_df = create_final_dataset(exports, imports)
+        partner_exports = partner_future.result()
+        supplier_df = supplier_future.result()
     
     # Save datasets
     print("\nSaving datasets...")
     
     # Main risk dataset
     risk_output = OUTPUT_DIR / "sector_risk_dataset.csv"
-    final_df.to_csv(risk_output, index=False)
+    write_csv(final_df, risk_output)
     print(f"  Saved: {risk_output}")
     
     # Partner-level trade data (for visualizations)
-    partner_exports = exports_df.groupby(['hs2', 'sector', 'country']).agg({
-        'export_value': 'sum'
-    }).reset_index()
-    partner_exports['country_name'] = partner_exports['country'].map(COUNTRY_NAMES).fillna(partner_exports['country'])
     partner_output = OUTPUT_DIR / "partner_trade_data.csv"
-    partner_exports.to_csv(partner_output, index=False)
+    write_csv(partner_exports, partner_output)
     print(f"  Saved: {partner_output}")
     
     # Supplier change data (for industry-level insights)
     supplier_output = OUTPUT_DIR / "supplier_change_data.csv"
-    supplier_df.to_csv(supplier_output, index=False)
+    write_csv(supplier_df, supplier_output)
     print(f"  Saved: {supplier_output}")
     
     # Summary statistics
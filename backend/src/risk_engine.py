@@ -15,11 +15,18 @@ This module does NOT:
 - Call LLMs or AI APIs
 """
 
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import logging
 
+import numpy as np
+
 from .schemas import (
     Partner,
+    PARTNER_INDEX,
+    partner_columns_key,
+    partners_key,
+    partners_from_key,
     SectorSummary,
     ScenarioInput,
     ExplainabilityOutput,
@@ -27,7 +34,14 @@ from .schemas import (
     RiskEngineResponse
 )
 from .load_data import DataLoader, get_data_loader
-from .tariff_data import get_tariff_rate, get_all_tariffed_sectors, US_TARIFFS_ON_CANADA
+from .risk_kernel import risk_kernel, rank_order, round_array, build_exposure_table, exposure_column
+from .tariff_data import (
+    get_tariff_rate,
+    get_all_tariffed_sectors,
+    build_tariff_matrix,
+    TARIFF_PARTNERS,
+    US_TARIFFS_ON_CANADA
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +87,175 @@ class RiskEngine:
         """
         self.data_loader = data_loader or get_data_loader()
         self._ensure_data_loaded()
+        self._build_sector_arrays()
+        # Per-instance so cached responses never outlive their engine;
+        # typed so that e.g. tariff 10 and 10.0 (echoed back) stay distinct
+        self._scenario_cache = lru_cache(maxsize=256, typed=True)(self._calculate_scenario)
+    
+    def _build_sector_arrays(self) -> None:
+        """
+        Materialize the sector data as contiguous arrays, once.
+        
+        Row i of every array belongs to self._sector_ids[i]; scenario
+        evaluation then runs as a few NumPy operations over all sectors.
+        """
+        sectors = list(self.data_loader.sector_summaries.values())
+        
+        # Arrays stay float64: total exports reach ~2.4e12, where float32 is
+        # off by up to ~1.3e5 per value, far beyond the cent-level
+        # affected_export_value, and float32 risk scores can flip a 0.1 rounding
+        self._sector_ids: List[str] = [s.sector_id for s in sectors]
+        self._sector_index: Dict[str, int] = {sid: i for i, sid in enumerate(self._sector_ids)}
+        self._shares = np.array(
+            [s.shares_array for s in sectors], dtype=np.float64
+        ).reshape(len(sectors), len(PARTNER_INDEX))
+        self._concentration = np.array([s.hhi_concentration for s in sectors], dtype=np.float64)
+        self._total_exports = np.array([s.total_exports for s in sectors], dtype=np.float64)
+        # Exposure for every ordered selection of distinct partners: scenarios
+        # gather a precomputed row instead of re-summing shares
+        # (indexed by partner_columns_key, the integer form of the selection)
+        self._exposure_table, index = build_exposure_table(self._shares)
+        self._exposure_index: Dict[int, int] = {
+            partner_columns_key(cols): row for cols, row in index.items()
+        }
+        # Static per-sector output fields
+        self._sector_names: List[str] = [s.sector_name for s in sectors]
+        self._top_partners: List[str] = [s.top_partner.value for s in sectors]
+        self._dependency_percent = round_array(
+            np.array([s.top_partner_share for s in sectors], dtype=np.float64) * 100, 1
+        )
+        # Actual tariff rates on Canada, one column per TARIFF_PARTNERS entry
+        self._tariffs = build_tariff_matrix(self._sector_ids)
+        
+        # Read-only after construction: keeps the arrays shared (never copied
+        # on write) between forked server workers, and guards against
+        # accidental mutation of engine state
+        for array in (self._shares, self._exposure_table, self._concentration,
+                      self._total_exports, self._dependency_percent, self._tariffs):
+            array.flags.writeable = False
+    
+    def _select_sectors(self, sector_filter: Optional[List[str]]) -> np.ndarray:
+        """Row indices for the requested sectors (unknown IDs are logged and skipped)."""
+        if not sector_filter:
+            return np.arange(len(self._sector_ids))
+        rows = []
+        for sector_id in sector_filter:
+            row = self._sector_index.get(sector_id)
+            if row is None:
+                logger.warning(f"Unknown sector_id: {sector_id}, skipping")
+                continue
+            rows.append(row)
+        return np.array(rows, dtype=np.intp)
+    
+    def _sector_exposure(self, partners: int) -> np.ndarray:
+        """
+        Exposure column (one value per sector) for the partner selection
+        encoded by partners, a partners_key.
+        
+        Read from the precomputed exposure table; selections with repeated
+        partners are not tabulated and are summed on the fly instead.
+        """
+        row = self._exposure_index.get(partners)
+        if row is None:
+            # Repeated partners aren't tabulated; sum them the same way
+            cols = [PARTNER_INDEX[p] for p in partners_from_key(partners)]
+            return exposure_column(self._shares, cols)
+        return self._exposure_table[row]
+    
+    def _run_kernel(
+        self,
+        rows: np.ndarray,
+        partners: int,
+        tariff_percent
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Run the risk kernel over the given sector rows.
+        
+        Args:
+            rows: Sector row indices
+            partners: partners_key of the partners whose shares count as exposure
+            tariff_percent: Scalar tariff, or one tariff per row
+            
+        Returns:
+            (shock, exposure, risk_scores, affected) arrays, unrounded, in row order
+        """
+        n = len(rows)
+        shock = np.empty(n)
+        shock[:] = np.asarray(tariff_percent, dtype=np.float64) / MAX_TARIFF_PERCENT
+        
+        exposure, risk_scores, affected = np.empty((3, n))
+        risk_kernel(
+            self._sector_exposure(partners), self._concentration, self._total_exports,
+            rows, shock, W_EXPOSURE, W_CONCENTRATION, exposure, risk_scores, affected
+        )
+        return shock, exposure, risk_scores, affected
+    
+    def _evaluate(
+        self,
+        rows: np.ndarray,
+        partners: int,
+        tariff_percent
+    ) -> Tuple[List[SectorRiskOutput], List[SectorRiskOutput]]:
+        """
+        Evaluate the risk formula for many sectors at once.
+        
+        Args:
+            rows: Sector row indices
+            partners: partners_key of the partners whose shares count as exposure
+            tariff_percent: Scalar tariff, or one tariff per row
+            
+        Returns:
+            (sectors, biggest_movers): one SectorRiskOutput per row ranked by
+            risk_score then risk_delta (descending), and the top 5 of those
+            by absolute risk_delta
+        """
+        shock, exposure, risk_scores, affected = self._run_kernel(rows, partners, tariff_percent)
+        concentration = self._concentration[rows]
+        
+        # Round every output column in one pass, then build the records
+        # (same values as _build_sector_output, without per-sector rounding)
+        risk_rounded = round_array(risk_scores, 1)
+        risk_scores = risk_rounded.tolist()
+        exposure_r = round_array(exposure, 4).tolist()
+        concentration_r = round_array(concentration, 4).tolist()
+        shock_r = round_array(shock, 4).tolist()
+        exposure_c = round_array(W_EXPOSURE * exposure, 4).tolist()
+        concentration_c = round_array(W_CONCENTRATION * concentration, 4).tolist()
+        affected_r = round_array(affected, 2).tolist()
+        dependency = self._dependency_percent[rows].tolist()
+        
+        ids, names, top_partners = self._sector_ids, self._sector_names, self._top_partners
+        results = [
+            SectorRiskOutput(
+                sector_id=ids[row],
+                sector_name=names[row],
+                risk_score=risk_scores[i],
+                # Baseline risk is 0, so the delta is the (already rounded) score
+                risk_delta=risk_scores[i],
+                exposure=exposure_r[i],
+                concentration=concentration_r[i],
+                shock=shock_r[i],
+                top_partner=top_partners[row],
+                dependency_percent=dependency[i],
+                affected_export_value=affected_r[i],
+                explainability=ExplainabilityOutput(
+                    exposure_value=exposure_r[i],
+                    concentration_value=concentration_r[i],
+                    shock_value=shock_r[i],
+                    exposure_component=exposure_c[i],
+                    concentration_component=concentration_c[i]
+                )
+            )
+            for i, row in enumerate(rows.tolist())
+        ]
+        
+        # Rank on the rounded arrays (same ties as sorting the records) and
+        # pick the movers with a partial selection instead of a second sort;
+        # risk_delta equals risk_score, so it adds no tie-break key
+        order = rank_order(risk_rounded)
+        sectors = [results[i] for i in order.tolist()]
+        movers = rank_order(np.abs(risk_rounded[order]), k=5)
+        return sectors, [sectors[i] for i in movers.tolist()]
     
     def _ensure_data_loaded(self) -> None:
         """Ensure data is loaded before calculations."""
@@ -99,10 +282,10 @@ class RiskEngine:
         if not target_partners:
             return 0.0
         
+        shares = sector.shares_array
         exposure = 0.0
         for partner in target_partners:
-            partner_key = partner.value  # "US", "China", "EU", "Other"
-            exposure += sector.partner_shares.get(partner_key, 0.0)
+            exposure += shares.item(PARTNER_INDEX[partner])
         
         # Clamp to [0, 1]
         return min(1.0, max(0.0, exposure))
@@ -176,11 +359,12 @@ class RiskEngine:
             Risk score in range [0, 100], rounded to 1 decimal
         """
         risk_raw = self.calculate_raw_risk(exposure, concentration, shock)
-        risk_score = risk_raw * 100
+        # Clamp (branch-free) to guard the [0, 100] bound whatever the inputs
+        risk_score = min(100.0, max(0.0, risk_raw * 100))
         return round(risk_score, 1)
     
+    @staticmethod
     def calculate_affected_export_value(
-        self, 
         total_exports: float, 
         exposure: float, 
         shock: float
@@ -238,15 +422,27 @@ class RiskEngine:
         # Calculate risk score
         risk_score = self.calculate_risk_score(exposure, concentration, shock)
         
+        # Affected export value (proxy), inlined calculate_affected_export_value
+        affected_export_value = sector.total_exports * exposure * shock
+        
+        return self._build_sector_output(
+            sector, exposure, concentration, shock, risk_score, affected_export_value
+        )
+    
+    def _build_sector_output(
+        self,
+        sector: SectorSummary,
+        exposure: float,
+        concentration: float,
+        shock: float,
+        risk_score: float,
+        affected_export_value: float
+    ) -> SectorRiskOutput:
+        """Assemble the rounded output record for one sector from its computed components."""
         # Baseline risk (tariff_percent = 0 → shock = 0 → baseline_risk = 0)
         baseline_risk = 0.0
         risk_delta = risk_score - baseline_risk
         
-        # Affected export value (proxy)
-        affected_export_value = self.calculate_affected_export_value(
-            sector.total_exports, exposure, shock
-        )
-        
         # Explainability output
         explainability = ExplainabilityOutput(
             exposure_value=round(exposure, 4),
@@ -307,44 +503,30 @@ class RiskEngine:
         """
         self._ensure_data_loaded()
         
-        # Get sectors to process
-        all_sectors = self.data_loader.sector_summaries
-        
-        if scenario.sector_filter:
-            sector_ids = [s for s in scenario.sector_filter if s in all_sectors]
-        else:
-            sector_ids = list(all_sectors.keys())
-        
-        # Calculate risk for each sector
-        results: List[SectorRiskOutput] = []
-        for sector_id in sector_ids:
-            sector = all_sectors.get(sector_id)
-            if sector is None:
-                logger.warning(f"Unknown sector_id: {sector_id}, skipping")
-                continue
-            
-            try:
-                result = self.calculate_sector_risk(sector, scenario)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error calculating risk for sector {sector_id}: {e}")
-                continue
-        
-        # Sort by risk_score (descending), then by risk_delta (descending)
-        results.sort(key=lambda x: (-x.risk_score, -x.risk_delta))
-        
-        # Get biggest movers (top 5 by absolute risk_delta)
-        biggest_movers = sorted(
-            results, 
-            key=lambda x: abs(x.risk_delta), 
-            reverse=True
-        )[:5]
+        # Responses are pure functions of the scenario, so repeats (e.g. the
+        # baseline) come from the cache; the response is immutable
+        return self._scenario_cache(
+            scenario.tariff_percent,
+            scenario._partners_key,
+            scenario.sector_filter
+        )
+    
+    def _calculate_scenario(
+        self,
+        tariff_percent: float,
+        partners: int,
+        sector_filter: Optional[Tuple[str, ...]]
+    ) -> RiskEngineResponse:
+        """Uncached calculate_scenario, on hashable inputs (partners as partners_key)."""
+        # Calculate and rank risk for all selected sectors in one vectorized pass
+        rows = self._select_sectors(sector_filter)
+        results, biggest_movers = self._evaluate(rows, partners, tariff_percent)
         
         # Build response
         scenario_dict = {
-            "tariff_percent": scenario.tariff_percent,
-            "target_partners": [p.value for p in scenario.target_partners],
-            "sector_filter": scenario.sector_filter
+            "tariff_percent": tariff_percent,
+            "target_partners": tuple(p.value for p in partners_from_key(partners)),
+            "sector_filter": sector_filter
         }
         
         metadata = {
@@ -361,6 +543,42 @@ class RiskEngine:
             metadata=metadata
         )
     
+    def calculate_pair(
+        self,
+        baseline: ScenarioInput,
+        scenario: ScenarioInput
+    ) -> Tuple[List[SectorSummary], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate two scenarios over the same sectors for a side-by-side comparison.
+        
+        Both scenarios are evaluated on the same rows (selected by the
+        scenario's sector_filter), so results line up by position and no
+        per-sector join is needed.
+        
+        Args:
+            baseline: Reference scenario
+            scenario: Shocked scenario
+            
+        Returns:
+            (sectors, baseline_risk, scenario_risk, affected_export_value), in row
+            order; risk scores are rounded to 1 decimal and affected export value
+            (under the shocked scenario) to 2 decimals, as in SectorRiskOutput
+        """
+        self._ensure_data_loaded()
+        
+        rows = self._select_sectors(scenario.sector_filter)
+        _, _, risk_a, _ = self._run_kernel(rows, baseline._partners_key, baseline.tariff_percent)
+        _, _, risk_b, affected = self._run_kernel(rows, scenario._partners_key, scenario.tariff_percent)
+        
+        summaries = self.data_loader.sector_summaries
+        sectors = [summaries[self._sector_ids[row]] for row in rows]
+        return (
+            sectors,
+            round_array(risk_a, 1),
+            round_array(risk_b, 1),
+            round_array(affected, 2)
+        )
+    
     def get_baseline(self, sector_filter: Optional[List[str]] = None) -> RiskEngineResponse:
         """
         Get baseline risk (tariff_percent = 0).
@@ -371,11 +589,8 @@ class RiskEngine:
         Returns:
             Risk engine response with baseline values
         """
-        scenario = ScenarioInput(
-            tariff_percent=0,
-            target_partners=[],
-            sector_filter=sector_filter
-        )
+        # Constant, known-valid inputs: no need to re-run validation
+        scenario = ScenarioInput._unchecked(0, [], sector_filter)
         return self.calculate_scenario(scenario)
     
     def calculate_actual_tariffs_on_canada(
@@ -403,45 +618,18 @@ class RiskEngine:
         
         # Get sectors to process
         all_sectors = self.data_loader.sector_summaries
+        rows = self._select_sectors(sector_filter)
+        sector_ids = [self._sector_ids[row] for row in rows]
         
-        if sector_filter:
-            sector_ids = [s for s in sector_filter if s in all_sectors]
-        else:
-            sector_ids = list(all_sectors.keys())
-        
-        # Calculate risk for each sector using actual tariffs
-        results: List[SectorRiskOutput] = []
-        for sector_id in sector_ids:
-            sector = all_sectors.get(sector_id)
-            if sector is None:
-                continue
-            
-            # Get actual tariff rate for this sector
-            actual_tariff = self._get_actual_tariff_for_sector(sector_id, target_partners)
-            
-            # Create a scenario with the actual tariff
-            scenario = ScenarioInput(
-                tariff_percent=actual_tariff,
-                target_partners=target_partners,
-                sector_filter=None
-            )
-            
-            try:
-                result = self.calculate_sector_risk(sector, scenario, use_actual_tariffs=True)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error calculating actual tariff impact for sector {sector_id}: {e}")
-                continue
-        
-        # Sort by risk_score (descending)
-        results.sort(key=lambda x: (-x.risk_score, -x.risk_delta))
-        
-        # Get biggest movers
-        biggest_movers = sorted(
-            results, 
-            key=lambda x: abs(x.risk_delta), 
-            reverse=True
-        )[:5]
+        # Actual tariff for each sector: max over target partners, capped
+        # (vectorized _get_actual_tariff_for_sector), then one vectorized pass
+        actual_tariffs = np.zeros(len(rows))
+        for partner in target_partners:
+            if partner.value in TARIFF_PARTNERS:
+                np.maximum(actual_tariffs, self._tariffs[rows, TARIFF_PARTNERS.index(partner.value)], out=actual_tariffs)
+        np.minimum(actual_tariffs, MAX_TARIFF_PERCENT, out=actual_tariffs)
+        # Ranked by risk_score, with the biggest movers
+        results, biggest_movers = self._evaluate(rows, partners_key(target_partners), actual_tariffs)
         
         # Build response
         scenario_dict = {
@@ -453,8 +641,7 @@ class RiskEngine:
         
         # Include tariff rate info
         tariff_info = {}
-        for sector_id in sector_ids:
-            tariff = self._get_actual_tariff_for_sector(sector_id, target_partners)
+        for sector_id, tariff in zip(sector_ids, actual_tariffs.tolist()):
             if tariff > 0:
                 sector = all_sectors.get(sector_id)
                 if sector:
@@ -6,14 +6,21 @@ HTTP API endpoints for the Risk Engine.
 Uses Flask for HTTP routing.
 """
 
-from flask import Flask, request, jsonify, Response
-from typing import Optional
+from flask import Flask, request, Response
+from functools import lru_cache
+from itertools import combinations
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 import logging
 import gzip
-import json
+import hashlib
+
+import numpy as np
+import orjson
 
 from .schemas import Partner, ScenarioInput
 from .risk_engine import RiskEngine, create_risk_engine
+from .risk_kernel import rank_order, round_array
+from .tariff_data import TARIFF_PARTNERS
 from .load_data import load_data, get_data_loader
 from .ml_model import TariffRiskNN
 from .routes_backboard import register_backboard_routes
@@ -24,19 +31,172 @@ logger = logging.getLogger(__name__)
 from flask_cors import CORS
 
 
-def gzip_response(data):
-    """Helper to create gzipped JSON response for large payloads."""
-    content = json.dumps(data).encode('utf-8')
+def dumps_json(data: Any) -> bytes:
+    """Serialize a response payload with orjson (NumPy scalars/arrays allowed)."""
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def read_json() -> Any:
+    """
+    Parse the request body with orjson (None for an empty body).
+    
+    Raises orjson.JSONDecodeError (a ValueError) on malformed JSON.
+    """
+    return orjson.loads(request.get_data(cache=False) or b'null')
+
+
+def ojsonify(data: Any) -> Response:
+    """orjson-backed replacement for flask.jsonify."""
+    return Response(dumps_json(data), mimetype='application/json')
+
+
+# Cache policy for responses that never change while the process runs
+STATIC_CACHE_CONTROL = 'public, max-age=86400, immutable'
+
+
+def static_response(body: bytes, etag: str) -> Response:
+    """
+    Serve pre-serialized static JSON with a strong ETag and long-lived caching.
     
-    # Only compress if larger than 1KB
-    if len(content) > 1024:
-        gzip_buffer = gzip.compress(content)
-        response = Response(gzip_buffer, mimetype='application/json')
+    Answers 304 Not Modified when the client's If-None-Match matches.
+    """
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = STATIC_CACHE_CONTROL
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=512)
+def gzip_bytes(content: bytes) -> bytes:
+    """
+    Gzip a response body, memoized.
+    
+    Meant for bodies that are themselves cached (e.g. scenario responses):
+    the same bytes object comes back on every hit, so the lookup is cheap
+    and each body is compressed once.
+    """
+    return gzip.compress(content)
+
+
+def gzip_response(content: bytes) -> Response:
+    """Helper to create gzipped JSON response for large (cached) payloads."""
+    # Only compress if larger than 1KB and the client accepts gzip
+    if len(content) > 1024 and 'gzip' in request.accept_encodings:
+        response = Response(gzip_bytes(content), mimetype='application/json')
         response.headers['Content-Encoding'] = 'gzip'
         response.headers['Vary'] = 'Accept-Encoding'
         return response
     else:
-        return jsonify(data)
+        response = Response(content, mimetype='application/json')
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+
+# Partners a scenario may target (those with tariff data)
+VALID_PARTNERS = frozenset(TARIFF_PARTNERS)
+_PARTNER_BY_ID: Dict[str, Partner] = {p.value: p for p in Partner}
+_INVALID_PARTNER_HINT = f"Valid options: {set(TARIFF_PARTNERS)}"
+
+
+def parse_partners(raw: List[str]) -> List[Partner]:
+    """Map partner IDs from a request body to Partners; raises ValueError on an invalid ID."""
+    partners = []
+    for p in raw:
+        if p not in VALID_PARTNERS:
+            raise ValueError(f"Invalid partner: {p}. {_INVALID_PARTNER_HINT}")
+        partners.append(_PARTNER_BY_ID[p])
+    return partners
+
+
+def parse_partners_param(param: str, default: Partner = Partner.US) -> List[Partner]:
+    """
+    Partners from a comma-separated query param.
+    
+    The param is treated as a set: unknown IDs are ignored, repeats count
+    once, and partners come back in TARIFF_PARTNERS order.
+    """
+    requested = VALID_PARTNERS.intersection(map(str.strip, param.split(',')))
+    return [_PARTNER_BY_ID[p] for p in TARIFF_PARTNERS if p in requested] or [default]
+
+
+def parse_sectors_param(param: Optional[str]) -> Optional[List[str]]:
+    """Sector IDs from a comma-separated query param (None when absent or empty)."""
+    if not param:
+        return None
+    return [s.strip() for s in param.split(',')]
+
+
+def sectors_payload(engine: RiskEngine) -> Dict:
+    """Build the /api/sectors response body (static for a loaded engine)."""
+    result = [
+        {
+            "sector_id": s.sector_id,
+            "sector_name": s.sector_name,
+            "total_exports": s.total_exports,
+            "top_partner": s.top_partner.value,
+            "top_partner_share": s.top_partner_share
+        }
+        for s in engine.data_loader.sector_summaries.values()
+    ]
+    
+    return {
+        "count": len(result),
+        "sectors": result
+    }
+
+
+def config_payload(ml_model_available: bool) -> Dict:
+    """Build the /api/config response body."""
+    from .risk_engine import W_EXPOSURE, W_CONCENTRATION, MAX_TARIFF_PERCENT
+    
+    return {
+        "w_exposure": W_EXPOSURE,
+        "w_concentration": W_CONCENTRATION,
+        "max_tariff_percent": MAX_TARIFF_PERCENT,
+        "risk_formula": "risk = (w_exposure * exposure + w_concentration * concentration) * shock",
+        "shock_formula": "shock = tariff_percent / 25",
+        "ml_model_available": ml_model_available,
+        "ml_model_note": "ML model provides more accurate predictions based on neural network training"
+    }
+
+
+# /api/partners response body
+PARTNERS_PAYLOAD: Dict[str, Any] = {
+    "partners": [
+        {"id": "US", "name": "United States"},
+        {"id": "China", "name": "China"},
+        {"id": "EU", "name": "European Union"}
+    ],
+    "note": "All other countries are aggregated as 'Other'"
+}
+
+
+def tariff_rates_payload(engine: RiskEngine) -> Dict:
+    """Build the /api/tariff-rates response body (static for a loaded engine)."""
+    from .tariff_data import get_all_tariffed_sectors
+    
+    all_tariffs = get_all_tariffed_sectors()
+    
+    # Add sector names
+    result = []
+    for hs2, rates in all_tariffs.items():
+        sector = engine.data_loader.get_sector(hs2)
+        result.append({
+            "hs2": hs2,
+            "sector_name": sector.sector_name if sector else f"Sector {hs2}",
+            "tariff_rates": dict(rates),
+            "max_tariff": max(rates.values())
+        })
+    
+    # Sort by max tariff
+    result.sort(key=lambda x: -x['max_tariff'])
+    
+    return {
+        "description": "Actual tariff rates imposed on Canadian exports",
+        "note": "Includes Section 232 steel/aluminum, softwood lumber, and other duties",
+        "tariffs": result,
+        "total_tariffed_sectors": len(result)
+    }
 
 
 def create_app(data_dir: Optional[str] = None) -> Flask:
@@ -79,19 +239,80 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         logger.error(f"Failed to initialize risk engine: {e}")
         raise
     
+    # --------------------------------------------------------
+    # PRE-SERIALIZED RESPONSES
+    # --------------------------------------------------------
+    # Sectors, partners, config, baseline/scenario risk, tariff rates and
+    # unfiltered actual-tariff risk are pure functions of the static data, so
+    # their JSON bytes are built once and served as-is (the fully static ones
+    # with ETags, so clients can revalidate for free).
+    
+    @lru_cache(maxsize=128)
+    def baseline_json(sector_filter: Optional[Tuple[str, ...]]) -> bytes:
+        """Serialized baseline response, keyed on the (ordered) sector filter."""
+        response = engine.get_baseline(list(sector_filter) if sector_filter else None)
+        return dumps_json(response.to_dict())
+    
+    @lru_cache(maxsize=512)
+    def scenario_json(
+        tariff_percent: float,
+        target_partners: Tuple[Partner, ...],
+        sector_filter: Optional[Tuple[str, ...]]
+    ) -> bytes:
+        """
+        Serialized scenario response for already-validated inputs.
+        
+        Keyed on the exact inputs (partner and filter order included) since
+        the response echoes them; UIs step through a small set of scenarios,
+        so repeats are served from memory.
+        """
+        scenario = ScenarioInput._unchecked(
+            tariff_percent,
+            list(target_partners),
+            list(sector_filter) if sector_filter is not None else None
+        )
+        return dumps_json(engine.calculate_scenario(scenario).to_dict())
+    
+    app.config['BASELINE_JSON'] = baseline_json(None)
+    app.config['TARIFF_RATES_JSON'] = dumps_json(tariff_rates_payload(engine))
+    app.config['SECTORS_JSON'] = dumps_json(sectors_payload(engine))
+    app.config['PARTNERS_JSON'] = dumps_json(PARTNERS_PAYLOAD)
+    app.config['CONFIG_JSON'] = dumps_json(config_payload(app.config.get('ML_MODEL') is not None))
+    
+    # Actual-tariff responses for every partner subset, without a sector
+    # filter; keyed by the set of partner IDs
+    actual_tariffs_cache: Dict[FrozenSet[str], bytes] = {}
+    for r in range(1, len(TARIFF_PARTNERS) + 1):
+        for subset in combinations(TARIFF_PARTNERS, r):
+            response = engine.calculate_actual_tariffs_on_canada(
+                target_partners=[Partner(p) for p in subset]
+            )
+            actual_tariffs_cache[frozenset(subset)] = dumps_json(response.to_dict())
+    app.config['ACTUAL_TARIFFS_CACHE'] = actual_tariffs_cache
+    
+    # Strong ETags for the bodies that are served with long-lived caching
+    etags = {
+        name: hashlib.md5(app.config[name], usedforsecurity=False).hexdigest()
+        for name in ('BASELINE_JSON', 'TARIFF_RATES_JSON', 'SECTORS_JSON', 'PARTNERS_JSON', 'CONFIG_JSON')
+    }
+    
+    def static_json(name: str) -> Response:
+        """Serve one of the pre-serialized bodies above, honouring If-None-Match."""
+        return static_response(app.config[name], etags[name])
+    
     # --------------------------------------------------------
     # ROUTES
     # --------------------------------------------------------
     
-    @app.route('/health', methods=['GET'])
+    @app.get('/health')
     def health_check():
         """Health check endpoint."""
-        return jsonify({
+        return ojsonify({
             "status": "healthy",
             "engine_loaded": app.config.get('RISK_ENGINE') is not None
         })
     
-    @app.route('/api/sectors', methods=['GET'])
+    @app.get('/api/sectors')
     def list_sectors():
         """
         List all available sectors.
@@ -99,26 +320,9 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         Returns:
             JSON array of sector IDs and names
         """
-        engine: RiskEngine = app.config['RISK_ENGINE']
-        sectors = engine.data_loader.sector_summaries
-        
-        result = [
-            {
-                "sector_id": s.sector_id,
-                "sector_name": s.sector_name,
-                "total_exports": s.total_exports,
-                "top_partner": s.top_partner.value,
-                "top_partner_share": s.top_partner_share
-            }
-            for s in sectors.values()
-        ]
-        
-        return jsonify({
-            "count": len(result),
-            "sectors": result
-        })
+        return static_json('SECTORS_JSON')
     
-    @app.route('/api/sector/<sector_id>', methods=['GET'])
+    @app.get('/api/sector/<sector_id>')
     def get_sector(sector_id: str):
         """
         Get details for a specific sector.
@@ -133,9 +337,9 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         sector = engine.data_loader.get_sector(sector_id)
         
         if sector is None:
-            return jsonify({"error": f"Sector not found: {sector_id}"}), 404
+            return ojsonify({"error": f"Sector not found: {sector_id}"}), 404
         
-        return jsonify({
+        return ojsonify({
             "sector_id": sector.sector_id,
             "sector_name": sector.sector_name,
             "total_exports": sector.total_exports,
@@ -144,7 +348,7 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
             "top_partner_share": sector.top_partner_share
         })
     
-    @app.route('/api/baseline', methods=['GET'])
+    @app.get('/api/baseline')
     def get_baseline():
         """
         Get baseline risk scores (tariff_percent = 0).
@@ -155,18 +359,13 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         Returns:
             Risk engine response with baseline values
         """
-        engine: RiskEngine = app.config['RISK_ENGINE']
-        
-        # Parse sector filter
-        sector_filter = None
-        sectors_param = request.args.get('sectors')
-        if sectors_param:
-            sector_filter = [s.strip() for s in sectors_param.split(',')]
+        sector_filter = parse_sectors_param(request.args.get('sectors'))
+        if sector_filter is None:
+            return static_json('BASELINE_JSON')
         
-        response = engine.get_baseline(sector_filter)
-        return jsonify(response.to_dict())
+        return Response(baseline_json(tuple(sector_filter)), mimetype='application/json')
     
-    @app.route('/api/scenario', methods=['POST'])
+    @app.post('/api/scenario')
     def calculate_scenario():
         """
         Calculate risk for a given scenario.
@@ -181,65 +380,62 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         Returns:
             Risk engine response with ranked sectors
         """
-        engine: RiskEngine = app.config['RISK_ENGINE']
-        
         # Parse request body
-        data = request.get_json()
+        try:
+            data = read_json()
+        except orjson.JSONDecodeError:
+            return ojsonify({"error": "Request body must be valid JSON"}), 400
         if not data:
-            return jsonify({"error": "Request body is required"}), 400
+            return ojsonify({"error": "Request body is required"}), 400
         
         # Validate tariff_percent
         tariff_percent = data.get('tariff_percent')
         if tariff_percent is None:
-            return jsonify({"error": "tariff_percent is required"}), 400
+            return ojsonify({"error": "tariff_percent is required"}), 400
         
         try:
             tariff_percent = float(tariff_percent)
         except (ValueError, TypeError):
-            return jsonify({"error": "tariff_percent must be a number"}), 400
+            return ojsonify({"error": "tariff_percent must be a number"}), 400
         
         if not 0 <= tariff_percent <= 25:
-            return jsonify({
+            return ojsonify({
                 "error": f"tariff_percent must be in range [0, 25], got {tariff_percent}"
             }), 400
         
         # Validate target_partners
         target_partners_raw = data.get('target_partners', [])
         if not isinstance(target_partners_raw, list):
-            return jsonify({"error": "target_partners must be an array"}), 400
+            return ojsonify({"error": "target_partners must be an array"}), 400
         
-        valid_partners = {"US", "China", "EU"}
-        target_partners = []
-        for p in target_partners_raw:
-            if p not in valid_partners:
-                return jsonify({
-                    "error": f"Invalid partner: {p}. Valid options: {valid_partners}"
-                }), 400
-            target_partners.append(Partner(p))
+        try:
+            target_partners = parse_partners(target_partners_raw)
+        except ValueError as e:
+            return ojsonify({"error": str(e)}), 400
         
         # Parse optional sector_filter
         sector_filter = data.get('sector_filter')
         if sector_filter is not None and not isinstance(sector_filter, list):
-            return jsonify({"error": "sector_filter must be an array"}), 400
+            return ojsonify({"error": "sector_filter must be an array"}), 400
         
         # Create scenario and calculate
         try:
-            scenario = ScenarioInput(
-                tariff_percent=tariff_percent,
-                target_partners=target_partners,
-                sector_filter=sector_filter
+            # Inputs were validated above; identical scenarios hit the cache
+            content = scenario_json(
+                tariff_percent,
+                tuple(target_partners),
+                tuple(sector_filter) if sector_filter is not None else None
             )
-            response = engine.calculate_scenario(scenario)
             
             # Use gzip compression for large responses
-            return gzip_response(response.to_dict())
+            return gzip_response(content)
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
+            return ojsonify({"error": str(e)}), 400
         except Exception as e:
             logger.exception("Error calculating scenario")
-            return jsonify({"error": "Internal server error"}), 500
+            return ojsonify({"error": "Internal server error"}), 500
     
-    @app.route('/api/compare', methods=['POST'])
+    @app.post('/api/compare')
     def compare_scenarios():
         """
         Compare two scenarios side by side.
@@ -256,79 +452,104 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
                 },
                 "sector_filter": ["01", "02"]  # Optional
             }
+        
+        Query params:
+            sort: "false" returns comparison in sector order instead of by
+                risk_change (default: true)
+            response_format: "columnar" returns comparison as one array per
+                field ({"sector_id": [...], "baseline_risk": [...], ...})
+                instead of one object per sector
             
         Returns:
             Comparison of baseline vs scenario
         """
         engine: RiskEngine = app.config['RISK_ENGINE']
         
-        data = request.get_json()
+        try:
+            data = read_json()
+        except orjson.JSONDecodeError:
+            return ojsonify({"error": "Request body must be valid JSON"}), 400
         if not data:
-            return jsonify({"error": "Request body is required"}), 400
+            return ojsonify({"error": "Request body is required"}), 400
         
         # Parse baseline
         baseline_data = data.get('baseline', {"tariff_percent": 0, "target_partners": []})
         scenario_data = data.get('scenario')
         
         if not scenario_data:
-            return jsonify({"error": "scenario is required"}), 400
+            return ojsonify({"error": "scenario is required"}), 400
         
         sector_filter = data.get('sector_filter')
         
         try:
-            # Calculate baseline
             baseline_scenario = ScenarioInput(
                 tariff_percent=baseline_data.get('tariff_percent', 0),
                 target_partners=[Partner(p) for p in baseline_data.get('target_partners', [])],
                 sector_filter=sector_filter
             )
-            baseline_response = engine.calculate_scenario(baseline_scenario)
-            
-            # Calculate scenario
             shock_scenario = ScenarioInput(
                 tariff_percent=scenario_data.get('tariff_percent', 0),
                 target_partners=[Partner(p) for p in scenario_data.get('target_partners', [])],
                 sector_filter=sector_filter
             )
-            scenario_response = engine.calculate_scenario(shock_scenario)
             
-            # Build comparison
-            baseline_dict = {s.sector_id: s for s in baseline_response.sectors}
+            # Evaluate both scenarios over the same sectors
+            sectors, baseline_risk, scenario_risk, affected = engine.calculate_pair(
+                baseline_scenario, shock_scenario
+            )
+            risk_change = round_array(scenario_risk - baseline_risk, 1)
+            
+            def columns(idx: np.ndarray) -> Dict[str, Any]:
+                """Comparison fields for the given rows, one array/list per field."""
+                picked = [sectors[i] for i in idx.tolist()]
+                return {
+                    "sector_id": [s.sector_id for s in picked],
+                    "sector_name": [s.sector_name for s in picked],
+                    "baseline_risk": baseline_risk[idx],
+                    "scenario_risk": scenario_risk[idx],
+                    "risk_change": risk_change[idx],
+                    "affected_export_value": affected[idx],
+                    "top_partner": [s.top_partner.value for s in picked],
+                    "dependency_percent": [round(s.top_partner_share * 100, 1) for s in picked]
+                }
             
-            comparison = []
-            for sector in scenario_response.sectors:
-                baseline_sector = baseline_dict.get(sector.sector_id)
-                baseline_risk = baseline_sector.risk_score if baseline_sector else 0
-                
-                comparison.append({
-                    "sector_id": sector.sector_id,
-                    "sector_name": sector.sector_name,
-                    "baseline_risk": baseline_risk,
-                    "scenario_risk": sector.risk_score,
-                    "risk_change": round(sector.risk_score - baseline_risk, 1),
-                    "affected_export_value": sector.affected_export_value,
-                    "top_partner": sector.top_partner,
-                    "dependency_percent": sector.dependency_percent
-                })
+            def records(idx: np.ndarray) -> List[Dict]:
+                """Comparison rows for the given rows, one dict per sector."""
+                cols = columns(idx)
+                values = [v.tolist() if isinstance(v, np.ndarray) else v for v in cols.values()]
+                return [dict(zip(cols, row)) for row in zip(*values)]
             
-            # Sort by risk_change descending
-            comparison.sort(key=lambda x: -x['risk_change'])
+            # Biggest gainers need only a partial selection; ties keep the
+            # scenario ranking (risk descending, then sector order)
+            biggest_gainers = records(rank_order(risk_change, scenario_risk, 5))
             
-            return jsonify({
+            # Full comparison sorted by risk_change descending unless ?sort=false
+            if request.args.get('sort', 'true').lower() == 'false':
+                order = np.arange(len(sectors))
+            else:
+                order = rank_order(risk_change, scenario_risk)
+            
+            if request.args.get('response_format') == 'columnar':
+                # One array per field (serialized straight from NumPy)
+                comparison = columns(order)
+            else:
+                comparison = records(order)
+            
+            return ojsonify({
                 "baseline_scenario": baseline_data,
                 "shock_scenario": scenario_data,
                 "comparison": comparison,
-                "biggest_gainers": comparison[:5],
-                "total_sectors": len(comparison)
+                "biggest_gainers": biggest_gainers,
+                "total_sectors": len(order)
             })
             
         except ValueError as e:
-            return jsonify({"error": str(e)}), 400
+            return ojsonify({"error": str(e)}), 400
         except Exception as e:
             logger.exception("Error comparing scenarios")
-            return jsonify({"error": "Internal server error"}), 500
+            return ojsonify({"error": "Internal server error"}), 500
     
-    @app.route('/api/actual-tariffs', methods=['GET'])
+    @app.get('/api/actual-tariffs')
     def get_actual_tariffs_on_canada():
         """
         Get risk calculated using ACTUAL tariff rates on Canada.
@@ -347,36 +568,24 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         """
         engine: RiskEngine = app.config['RISK_ENGINE']
         
-        # Parse partners
-        partners_param = request.args.get('partners', 'US')
-        valid_partners = {"US", "China", "EU"}
-        target_partners = []
-        
-        for p in partners_param.split(','):
-            p = p.strip()
-            if p in valid_partners:
-                target_partners.append(Partner(p))
-        
-        if not target_partners:
-            target_partners = [Partner.US]
+        target_partners = parse_partners_param(request.args.get('partners', 'US'))
+        sector_filter = parse_sectors_param(request.args.get('sectors'))
         
-        # Parse sector filter
-        sector_filter = None
-        sectors_param = request.args.get('sectors')
-        if sectors_param:
-            sector_filter = [s.strip() for s in sectors_param.split(',')]
+        if sector_filter is None:
+            key = frozenset(p.value for p in target_partners)
+            return Response(app.config['ACTUAL_TARIFFS_CACHE'][key], mimetype='application/json')
         
         try:
             response = engine.calculate_actual_tariffs_on_canada(
                 target_partners=target_partners,
                 sector_filter=sector_filter
             )
-            return jsonify(response.to_dict())
+            return ojsonify(response.to_dict())
         except Exception as e:
             logger.exception("Error calculating actual tariff impact")
-            return jsonify({"error": "Internal server error"}), 500
+            return ojsonify({"error": "Internal server error"}), 500
     
-    @app.route('/api/tariff-rates', methods=['GET'])
+    @app.get('/api/tariff-rates')
     def get_tariff_rates():
         """
         Get the actual tariff rates on Canadian exports by sector.
@@ -384,62 +593,19 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         Returns:
             Dictionary of HS2 codes to tariff rates by partner
         """
-        from .tariff_data import get_all_tariffed_sectors, US_TARIFFS_ON_CANADA
-        
-        all_tariffs = get_all_tariffed_sectors()
-        engine: RiskEngine = app.config['RISK_ENGINE']
-        
-        # Add sector names
-        result = []
-        for hs2, rates in all_tariffs.items():
-            sector = engine.data_loader.get_sector(hs2)
-            result.append({
-                "hs2": hs2,
-                "sector_name": sector.sector_name if sector else f"Sector {hs2}",
-                "tariff_rates": rates,
-                "max_tariff": max(rates.values())
-            })
-        
-        # Sort by max tariff
-        result.sort(key=lambda x: -x['max_tariff'])
-        
-        return jsonify({
-            "description": "Actual tariff rates imposed on Canadian exports",
-            "note": "Includes Section 232 steel/aluminum, softwood lumber, and other duties",
-            "tariffs": result,
-            "total_tariffed_sectors": len(result)
-        })
+        return static_json('TARIFF_RATES_JSON')
     
-    @app.route('/api/partners', methods=['GET'])
+    @app.get('/api/partners')
     def list_partners():
         """List valid trading partners."""
-        return jsonify({
-            "partners": [
-                {"id": "US", "name": "United States"},
-                {"id": "China", "name": "China"},
-                {"id": "EU", "name": "European Union"}
-            ],
-            "note": "All other countries are aggregated as 'Other'"
-        })
+        return static_json('PARTNERS_JSON')
     
-    @app.route('/api/config', methods=['GET'])
+    @app.get('/api/config')
     def get_config():
         """Get risk engine configuration."""
-        from .risk_engine import W_EXPOSURE, W_CONCENTRATION, MAX_TARIFF_PERCENT
-        
-        ml_model = app.config.get('ML_MODEL')
-        
-        return jsonify({
-            "w_exposure": W_EXPOSURE,
-            "w_concentration": W_CONCENTRATION,
-            "max_tariff_percent": MAX_TARIFF_PERCENT,
-            "risk_formula": "risk = (w_exposure * exposure + w_concentration * concentration) * shock",
-            "shock_formula": "shock = tariff_percent / 25",
-            "ml_model_available": ml_model is not None,
-            "ml_model_note": "ML model provides more accurate predictions based on neural network training"
-        })
+        return static_json('CONFIG_JSON')
     
-    @app.route('/api/predict-ml', methods=['POST'])
+    @app.post('/api/predict-ml')
     def predict_ml_risk():
         """
         Predict tariff impact risk using trained neural network.
@@ -462,21 +628,21 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         ml_model = app.config.get('ML_MODEL')
         
         if ml_model is None:
-            return jsonify({
+            return ojsonify({
                 "error": "ML model not loaded",
                 "note": "Train and save the model first using scripts/train_ml_model.py"
             }), 503
         
         try:
-            data = request.get_json()
+            data = read_json()
             
             if not data:
-                return jsonify({"error": "No JSON payload provided"}), 400
+                return ojsonify({"error": "No JSON payload provided"}), 400
             
             # Predict
             pred_risk = ml_model.predict(data)
             
-            return jsonify({
+            return ojsonify({
                 "method": "neural_network",
                 "predicted_risk_score": round(pred_risk, 2),
                 "features_used": list(data.keys()),
@@ -485,9 +651,9 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
             
         except Exception as e:
             logger.error(f"ML prediction error: {e}")
-            return jsonify({"error": str(e)}), 400
+            return ojsonify({"error": str(e)}), 400
     
-    @app.route('/api/predict-ml-batch', methods=['POST'])
+    @app.post('/api/predict-ml-batch')
     def predict_ml_batch():
         """
         Predict tariff impact risk for multiple sectors using ML.
@@ -506,16 +672,16 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
         ml_model = app.config.get('ML_MODEL')
         
         if ml_model is None:
-            return jsonify({
+            return ojsonify({
                 "error": "ML model not loaded"
             }), 503
         
         try:
-            data = request.get_json()
+            data = read_json()
             sectors = data.get('sectors', [])
             
             if not sectors:
-                return jsonify({"error": "No sectors provided"}), 400
+                return ojsonify({"error": "No sectors provided"}), 400
             
             engine: RiskEngine = app.config['RISK_ENGINE']
             tariff_percent = data.get('tariff_percent', 10.0)
@@ -540,7 +706,7 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
                         "ml_predicted_risk": round(pred, 2)
                     })
             
-            return jsonify({
+            return ojsonify({
                 "method": "neural_network",
                 "count": len(results),
                 "predictions": results
@@ -548,16 +714,16 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
             
         except Exception as e:
             logger.error(f"ML batch prediction error: {e}")
-            return jsonify({"error": str(e)}), 400
+            return ojsonify({"error": str(e)}), 400
     
     # Error handlers
     @app.errorhandler(404)
     def not_found(e):
-        return jsonify({"error": "Endpoint not found"}), 404
+        return ojsonify({"error": "Endpoint not found"}), 404
     
     @app.errorhandler(500)
     def internal_error(e):
-        return jsonify({"error": "Internal server error"}), 500
+        return ojsonify({"error": "Internal server error"}), 500
     
     register_backboard_routes(app)
     register_gemini_routes(app)
@@ -567,10 +733,18 @@ def create_app(data_dir: Optional[str] = None) -> Flask:
 
 # For running directly
 if __name__ == '__main__':
-    import sys
+    import argparse
+    import os
+    
+    parser = argparse.ArgumentParser(description="Run the TradeRisk API with the Flask server")
+    parser.add_argument('data_dir', nargs='?', default=None, help="Data directory (optional)")
+    parser.add_argument('--debug', action='store_true',
+                        default=os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes'),
+                        help="Enable the Werkzeug debugger and reloader (or set FLASK_DEBUG=1)")
+    parser.add_argument('--verbose', action='store_true', help="Log at INFO instead of WARNING")
+    args = parser.parse_args()
     
-    logging.basicConfig(level=logging.INFO)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
     
-    data_dir = sys.argv[1] if len(sys.argv) > 1 else None
-    app = create_app(data_dir)
-    app.run(host='0.0.0.0', port=5001, debug=True)
+    app = create_app(args.data_dir)
+    app.run(host='0.0.0.0', port=5001, debug=args.debug)
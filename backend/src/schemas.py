@@ -5,9 +5,12 @@ Defines data validation schemas for the Risk Engine.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Literal
+from types import MappingProxyType
+from typing import Any, Iterable, Dict, Mapping, Optional, Literal, Sequence, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 class Partner(str, Enum):
     """Valid trading partner enum."""
@@ -17,7 +20,44 @@ class Partner(str, Enum):
     OTHER = "Other"
 
 
-@dataclass
+# Fixed partner order for array-valued shares (SectorSummary.shares_array)
+PARTNER_ORDER: Tuple[Partner, ...] = tuple(Partner)
+PARTNER_INDEX: Dict[Partner, int] = {p: i for i, p in enumerate(PARTNER_ORDER)}
+
+_KEY_BASE = len(PARTNER_ORDER) + 1
+
+
+def partner_columns_key(cols: Iterable[int]) -> int:
+    """
+    Integer key for an ordered selection of partner columns.
+    
+    Digit i (base len(PARTNER_ORDER) + 1) is the i-th column plus one, so
+    every sequence - order and repeats included - gets its own key, and
+    the empty selection is 0. Order has to be kept: exposure sums shares
+    in the given order, and scenarios echo their partners back.
+    """
+    key, scale = 0, 1
+    for col in cols:
+        key += (col + 1) * scale
+        scale *= _KEY_BASE
+    return key
+
+
+def partners_key(partners: Sequence[Partner]) -> int:
+    """Integer key for a sequence of partners (see partner_columns_key)."""
+    return partner_columns_key(PARTNER_INDEX[p] for p in partners)
+
+
+def partners_from_key(key: int) -> Tuple[Partner, ...]:
+    """Inverse of partners_key."""
+    partners = []
+    while key:
+        key, digit = divmod(key, _KEY_BASE)
+        partners.append(PARTNER_ORDER[digit - 1])
+    return tuple(partners)
+
+
+@dataclass(slots=True)
 class SectorPartnerExport:
     """
     Sector Partner Export record.
@@ -40,7 +80,7 @@ class SectorPartnerExport:
             raise ValueError("sector_name cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class SectorSummary:
     """
     Sector Summary record (derived or precomputed).
@@ -57,6 +97,8 @@ class SectorSummary:
     top_partner: Partner
     top_partner_share: float
     hhi_concentration: float = 0.0  # HHI market concentration index (0-1)
+    # partner_shares as a read-only array in PARTNER_ORDER (built on init)
+    _shares_arr: np.ndarray = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.total_exports < 0:
@@ -72,9 +114,20 @@ class SectorSummary:
         shares_sum = sum(self.partner_shares.values())
         if not 0.99 <= shares_sum <= 1.01:
             raise ValueError(f"partner_shares must sum to ~1, got {shares_sum}")
+        
+        shares_arr = np.array(
+            [self.partner_shares.get(p.value, 0.0) for p in PARTNER_ORDER], dtype=np.float64
+        )
+        shares_arr.flags.writeable = False
+        self._shares_arr = shares_arr
+    
+    @property
+    def shares_array(self) -> np.ndarray:
+        """Partner shares indexed by PARTNER_INDEX (missing partners are 0)."""
+        return self._shares_arr
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScenarioInput:
     """
     Scenario input for risk calculation.
@@ -82,23 +135,51 @@ class ScenarioInput:
     Constraints:
     - tariff_percent must be in range [0, 25]
     - empty target_partners means zero exposure
+    
+    Partners and the sector filter are stored as tuples (any sequence is
+    accepted), so scenarios are immutable and hashable.
     """
     tariff_percent: float
-    target_partners: List[Partner]
-    sector_filter: Optional[List[str]] = None
+    target_partners: Tuple[Partner, ...]
+    sector_filter: Optional[Tuple[str, ...]] = None
+    # partners_key(target_partners): a one-word hash and cache key
+    _partners_key: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not 0 <= self.tariff_percent <= 25:
             raise ValueError(f"tariff_percent must be in [0, 25], got {self.tariff_percent}")
         
         # Convert string partners to enum if needed
-        self.target_partners = [
+        object.__setattr__(self, 'target_partners', tuple(
             Partner(p) if isinstance(p, str) else p 
             for p in self.target_partners
-        ]
+        ))
+        if self.sector_filter is not None:
+            object.__setattr__(self, 'sector_filter', tuple(self.sector_filter))
+        object.__setattr__(self, '_partners_key', partners_key(self.target_partners))
+    
+    @classmethod
+    def _unchecked(
+        cls,
+        tariff_percent: float,
+        target_partners: Sequence[Partner],
+        sector_filter: Optional[Sequence[str]] = None
+    ) -> "ScenarioInput":
+        """
+        Build a ScenarioInput without running __post_init__ validation.
+        
+        Only for callers that have already validated the tariff range and
+        converted target_partners to Partner members.
+        """
+        scenario = cls.__new__(cls)
+        object.__setattr__(scenario, 'tariff_percent', tariff_percent)
+        object.__setattr__(scenario, 'target_partners', tuple(target_partners))
+        object.__setattr__(scenario, 'sector_filter', tuple(sector_filter) if sector_filter is not None else None)
+        object.__setattr__(scenario, '_partners_key', partners_key(target_partners))
+        return scenario
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExplainabilityOutput:
     """Explainability output for a sector's risk calculation."""
     exposure_value: float
@@ -108,7 +189,7 @@ class ExplainabilityOutput:
     concentration_component: float  # w_concentration * concentration
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SectorRiskOutput:
     """
     Output schema for a single sector's risk calculation.
@@ -151,19 +232,30 @@ class SectorRiskOutput:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskEngineResponse:
-    """Complete response from the risk engine."""
-    scenario: Dict
-    sectors: List[SectorRiskOutput]
-    biggest_movers: List[SectorRiskOutput]
-    metadata: Dict = field(default_factory=dict)
+    """
+    Complete response from the risk engine.
+    
+    Immutable, since the engine caches and shares responses between callers:
+    sector lists are stored as tuples and scenario/metadata as read-only views.
+    """
+    scenario: Mapping[str, Any]
+    sectors: Tuple[SectorRiskOutput, ...]
+    biggest_movers: Tuple[SectorRiskOutput, ...]
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'scenario', MappingProxyType(dict(self.scenario)))
+        object.__setattr__(self, 'sectors', tuple(self.sectors))
+        object.__setattr__(self, 'biggest_movers', tuple(self.biggest_movers))
+        object.__setattr__(self, 'metadata', MappingProxyType(dict(self.metadata)))
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
         return {
-            "scenario": self.scenario,
+            "scenario": dict(self.scenario),
             "sectors": [s.to_dict() for s in self.sectors],
             "biggest_movers": [s.to_dict() for s in self.biggest_movers],
-            "metadata": self.metadata
+            "metadata": dict(self.metadata)
         }
@@ -13,6 +13,11 @@ Sources:
 Note: These are representative rates for simulation purposes.
 """
 
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Union
+
+import numpy as np
+
 # US Tariffs on Canadian Products by HS2 Category
 # Format: HS2 code -> tariff rate (%)
 US_TARIFFS_ON_CANADA = {
@@ -65,6 +70,58 @@ EU_TARIFFS_ON_CANADA = {
 # Default tariff rate for sectors without specific tariffs
 DEFAULT_TARIFF_RATE = 0.0
 
+# Partners with tariff tables, in tariff matrix column order
+TARIFF_PARTNERS = ("US", "China", "EU")
+_PARTNER_IDX = {partner: i for i, partner in enumerate(TARIFF_PARTNERS)}
+
+_TARIFF_TABLES = (US_TARIFFS_ON_CANADA, CHINA_TARIFFS_ON_CANADA, EU_TARIFFS_ON_CANADA)
+
+
+# Every tariffed HS2 code (first-seen order across the tables) and its rates,
+# one row per code and one column per TARIFF_PARTNERS entry
+_TARIFFED_CODES = list(dict.fromkeys(hs2 for table in _TARIFF_TABLES for hs2 in table))
+_MATRIX = np.array(
+    [[table.get(hs2, DEFAULT_TARIFF_RATE) for table in _TARIFF_TABLES] for hs2 in _TARIFFED_CODES],
+    dtype=np.float64
+).reshape(len(_TARIFFED_CODES), len(TARIFF_PARTNERS))
+_MATRIX.flags.writeable = False
+
+# Matrix row of each tariffed code, keyed by every form callers pass in
+# ("07", "7" and 7), so lookups need no per-call string normalization
+_sector_pos: Dict[Union[str, int], int] = {}
+for _row, _hs2 in enumerate(_TARIFFED_CODES):
+    _sector_pos[_hs2] = _sector_pos[_hs2.lstrip("0") or "0"] = _sector_pos[int(_hs2)] = _row
+
+# Per-sector rates for every tariffed sector; partners without a tariff keep 0.
+# Read-only views, so the shared table can be handed out without copying
+ALL_TARIFFED_SECTORS: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    hs2: MappingProxyType({
+        partner: table.get(hs2, 0)
+        for partner, table in zip(TARIFF_PARTNERS, _TARIFF_TABLES)
+    })
+    for hs2 in _TARIFFED_CODES
+})
+
+
+def build_tariff_matrix(sector_ids: List[str]) -> np.ndarray:
+    """
+    Build a dense tariff matrix aligned with the given sector order.
+    
+    Args:
+        sector_ids: HS2 codes, one per row
+        
+    Returns:
+        Array of shape (len(sector_ids), len(TARIFF_PARTNERS)) with the tariff
+        rate (%) each partner imposes on each sector
+    """
+    matrix = np.full((len(sector_ids), len(TARIFF_PARTNERS)), DEFAULT_TARIFF_RATE, dtype=np.float64)
+    for row, sector_id in enumerate(sector_ids):
+        pos = _sector_pos.get(sector_id)
+        if pos is not None:
+            matrix[row] = _MATRIX[pos]
+    return matrix
+
+
 def get_tariff_rate(hs2_code: str, partner: str) -> float:
     """
     Get the tariff rate for a specific HS2 sector and trading partner.
@@ -76,44 +133,19 @@ def get_tariff_rate(hs2_code: str, partner: str) -> float:
     Returns:
         Tariff rate as a percentage (0-100)
     """
-    hs2 = str(hs2_code).zfill(2)
-    
-    if partner == "US":
-        return US_TARIFFS_ON_CANADA.get(hs2, DEFAULT_TARIFF_RATE)
-    elif partner == "China":
-        return CHINA_TARIFFS_ON_CANADA.get(hs2, DEFAULT_TARIFF_RATE)
-    elif partner == "EU":
-        return EU_TARIFFS_ON_CANADA.get(hs2, DEFAULT_TARIFF_RATE)
-    else:
+    pos = _sector_pos.get(hs2_code)
+    col = _PARTNER_IDX.get(partner)
+    if pos is None or col is None:
         return DEFAULT_TARIFF_RATE
+    return float(_MATRIX[pos, col])
 
 def get_max_tariff_rate(hs2_code: str) -> float:
     """Get the maximum tariff rate across all partners for a sector."""
-    hs2 = str(hs2_code).zfill(2)
-    rates = [
-        US_TARIFFS_ON_CANADA.get(hs2, 0),
-        CHINA_TARIFFS_ON_CANADA.get(hs2, 0),
-        EU_TARIFFS_ON_CANADA.get(hs2, 0)
-    ]
-    return max(rates)
-
-def get_all_tariffed_sectors() -> dict:
-    """Get all sectors with non-zero tariffs."""
-    all_sectors = {}
-    
-    for hs2, rate in US_TARIFFS_ON_CANADA.items():
-        if hs2 not in all_sectors:
-            all_sectors[hs2] = {"US": 0, "China": 0, "EU": 0}
-        all_sectors[hs2]["US"] = rate
-    
-    for hs2, rate in CHINA_TARIFFS_ON_CANADA.items():
-        if hs2 not in all_sectors:
-            all_sectors[hs2] = {"US": 0, "China": 0, "EU": 0}
-        all_sectors[hs2]["China"] = rate
-    
-    for hs2, rate in EU_TARIFFS_ON_CANADA.items():
-        if hs2 not in all_sectors:
-            all_sectors[hs2] = {"US": 0, "China": 0, "EU": 0}
-        all_sectors[hs2]["EU"] = rate
-    
-    return all_sectors
+    pos = _sector_pos.get(hs2_code)
+    if pos is None:
+        return 0
+    return float(_MATRIX[pos].max())
+
+def get_all_tariffed_sectors() -> Mapping[str, Mapping[str, float]]:
+    """Get all sectors with non-zero tariffs (read-only, precomputed at import)."""
+    return ALL_TARIFFED_SECTORS
@@ -0,0 +1,91 @@
+"""
+Dataset Preparation Tests
+=========================
+Tests for the trade loaders and the scoring and scenario functions of the
+dataset preparation script.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Import the script under the name it has when run directly (its directory
+# on sys.path), so the Numba cache it writes stays loadable from the script
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import prepare_tariff_risk_dataset as prepare
+from prepare_tariff_risk_dataset import (
+    calculate_risk_score,
+    score_sectors,
+    simulate_tariff_scenario,
+    simulate_tariff_scenarios,
+)
+
+
+@pytest.fixture(scope="module")
+def sector_data() -> pd.DataFrame:
+    """Random sector-level metrics; there is no exposure_jp column."""
+    rng = np.random.default_rng(0)
+    n = 30
+    return pd.DataFrame({
+        'export_value': rng.random(n) * 1e9,
+        'exposure_us': rng.random(n),
+        'exposure_cn': rng.random(n),
+        'hhi_concentration': rng.random(n),
+        'top_partner_share': rng.random(n),
+    })
+
+
+def test_scenario_sweep_matches_single_scenarios(sector_data):
+    """Each scenario in a sweep equals running that scenario on its own."""
+    tariffs = [0, 5, 12.5, 25]
+    partners = ['US', 'CN', 'JP']
+    sweep = simulate_tariff_scenarios(sector_data, tariffs, partners)
+    
+    assert len(sweep) == len(sector_data) * len(tariffs) * len(partners)
+    for partner in partners:
+        for tariff in tariffs:
+            single = simulate_tariff_scenario(sector_data, tariff, partner)
+            scenario = sweep.xs((partner, float(tariff)), level=['target_partner', 'tariff_pct'])
+            for col in scenario.columns:
+                assert scenario[col].tolist() == single[col].tolist()
+
+
+def test_single_scenario_matches_score_sectors(sector_data):
+    """The scenario and baseline functions agree with the one-pass scoring."""
+    scored = score_sectors(sector_data, tariff_pct=10, target_partner='CN')
+    single = simulate_tariff_scenario(sector_data, 10, 'CN')
+    for col in ('shocked_risk_score', 'risk_delta', 'affected_export_value'):
+        assert single[col].tolist() == scored[col].tolist()
+    assert calculate_risk_score(sector_data)['risk_score'].tolist() == scored['risk_score'].tolist()
+
+
+def test_missing_partner_column_means_no_exposure(sector_data):
+    """A partner without an exposure column leaves risk unchanged."""
+    single = simulate_tariff_scenario(sector_data, 25, 'JP')
+    assert (single['risk_delta'] == 0).all()
+    assert (single['affected_export_value'] == 0).all()
+
+
+def test_rows_without_country_are_dropped(tmp_path, monkeypatch):
+    """Trade rows with an empty country cell are left out of every aggregate."""
+    export_dir = tmp_path / "2024_EXP_HS2"
+    export_dir.mkdir()
+    (export_dir / "2024_EXP_HS2.csv").write_text(
+        "YearMonth,HS2,Country,State,Value\n"
+        "202401,72,US,NY,100\n"
+        "202402,72,,NY,50\n"
+        "202401,72,CN,CA,25\n"
+        "202401,87,,CA,10\n"
+    )
+    monkeypatch.setattr(prepare, "DATA_DIR", tmp_path)
+    
+    exports = prepare.load_export_data().collect()
+    assert exports['country'].null_count() == 0
+    assert exports['export_value'].sum() == 125
+    
+    partner_exports = prepare.build_partner_trade_data(prepare.load_export_data())
+    assert partner_exports[['hs2', 'country']].astype(str).values.tolist() == [['72', 'CN'], ['72', 'US']]
@@ -19,6 +19,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.schemas import (
     Partner,
+    PARTNER_INDEX,
+    partners_key,
+    partners_from_key,
     SectorSummary,
     ScenarioInput,
     SectorPartnerExport,
@@ -38,7 +41,7 @@ from src.risk_engine import (
 # TEST FIXTURES
 # ============================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_sector() -> SectorSummary:
     """Create a sample sector for testing."""
     return SectorSummary(
@@ -57,7 +60,7 @@ def sample_sector() -> SectorSummary:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_sector_low_us() -> SectorSummary:
     """Create a sector with low US exposure."""
     return SectorSummary(
@@ -76,7 +79,7 @@ def sample_sector_low_us() -> SectorSummary:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_engine(sample_sector, sample_sector_low_us):
     """Create a mock risk engine with test data."""
     from src.load_data import DataLoader
@@ -158,6 +161,45 @@ class TestSchemaValidation:
                 target_partners=[Partner.US]
             )
 
+    def test_scenario_input_unchecked_equals_validated(self):
+        """Unchecked construction should match the validated one for valid input."""
+        checked = ScenarioInput(tariff_percent=10, target_partners=[Partner.US], sector_filter=["87"])
+        unchecked = ScenarioInput._unchecked(10, [Partner.US], ["87"])
+        assert unchecked == checked
+        assert unchecked._partners_key == checked._partners_key
+    
+    def test_scenario_input_is_hashable(self):
+        """Scenarios store tuples, so equal scenarios hash equally."""
+        scenario = ScenarioInput(10, ["US", "EU"], ["87", "72"])
+        assert scenario.target_partners == (Partner.US, Partner.EU)
+        assert scenario.sector_filter == ("87", "72")
+        assert hash(scenario) == hash(ScenarioInput._unchecked(10, [Partner.US, Partner.EU], ["87", "72"]))
+    
+    def test_partners_key_keeps_order_and_repeats(self):
+        """Partner keys round-trip and tell apart orderings and repeats."""
+        selections = [(), (Partner.US,), (Partner.EU, Partner.US), (Partner.US, Partner.EU),
+                      (Partner.US, Partner.US), tuple(Partner)]
+        keys = [partners_key(p) for p in selections]
+        assert len(set(keys)) == len(keys)
+        assert [partners_from_key(k) for k in keys] == selections
+        assert ScenarioInput(10, ["EU", "US"])._partners_key == keys[2]
+
+    def test_sector_shares_array(self, sample_sector):
+        """shares_array mirrors partner_shares in PARTNER_INDEX order and is read-only."""
+        for partner, col in PARTNER_INDEX.items():
+            assert sample_sector.shares_array[col] == sample_sector.partner_shares[partner.value]
+        assert not sample_sector.shares_array.flags.writeable
+        
+        partial = SectorSummary(
+            sector_id="01", sector_name="Test", total_exports=1.0,
+            partner_shares={"US": 1.0}, top_partner=Partner.US, top_partner_share=1.0
+        )
+        assert partial.shares_array.tolist() == [1.0, 0.0, 0.0, 0.0]
+    
+    def test_schemas_use_slots(self, sample_sector):
+        """Schema records should not carry a per-instance __dict__."""
+        assert not hasattr(sample_sector, '__dict__')
+
 
 # ============================================================
 # EXPOSURE CALCULATION TESTS
@@ -427,8 +469,9 @@ class TestGoldenOutput:
         assert result.explainability.exposure_value == expected_exposure
         assert result.explainability.concentration_value == expected_concentration
         assert result.explainability.shock_value == expected_shock
-        assert result.explainability.exposure_component == pytest.approx(W_EXPOSURE * expected_exposure, rel=0.01)
-        assert result.explainability.concentration_component == pytest.approx(W_CONCENTRATION * expected_concentration, rel=0.01)
+        # Components are the weight times the unrounded input, rounded to 4 places
+        assert result.explainability.exposure_component == round(W_EXPOSURE * expected_exposure, 4)
+        assert result.explainability.concentration_component == round(W_CONCENTRATION * expected_concentration, 4)
 
 
 # ============================================================
@@ -464,6 +507,7 @@ class TestAffectedExportValue:
         
         expected = total * exposure * shock
         actual = mock_engine.calculate_affected_export_value(total, exposure, shock)
+        assert RiskEngine.calculate_affected_export_value(total, exposure, shock) == actual
         
         assert actual == expected
 
@@ -513,6 +557,24 @@ class TestScenarioResponse:
         assert len(response.sectors) == 1
         assert response.sectors[0].sector_id == "87"
 
+    def test_scenario_matches_per_sector_calculation(self, mock_engine, sample_sector, sample_sector_low_us):
+        """Vectorized scenario results should equal the scalar per-sector path."""
+        scenario = ScenarioInput(
+            tariff_percent=15,
+            target_partners=[Partner.US, Partner.EU]
+        )
+        response = mock_engine.calculate_scenario(scenario)
+
+        by_id = {s.sector_id: s for s in response.sectors}
+        assert by_id["87"] == mock_engine.calculate_sector_risk(sample_sector, scenario)
+        assert by_id["30"] == mock_engine.calculate_sector_risk(sample_sector_low_us, scenario)
+
+    def test_engine_arrays_are_read_only(self, mock_engine):
+        """Precomputed arrays are write-protected so forked workers keep sharing them."""
+        for array in (mock_engine._shares, mock_engine._concentration,
+                      mock_engine._total_exports, mock_engine._tariffs):
+            assert not array.flags.writeable
+
 
 # ============================================================
 # BASELINE TESTS
@@ -521,6 +583,28 @@ class TestScenarioResponse:
 class TestBaseline:
     """Test baseline calculation."""
     
+    def test_baseline_is_cached_and_immutable(self, mock_engine):
+        """Repeated baselines share one immutable response object."""
+        response = mock_engine.get_baseline()
+        assert mock_engine.get_baseline() is response
+        
+        with pytest.raises(AttributeError):
+            response.sectors = ()
+        with pytest.raises(TypeError):
+            response.metadata["total_sectors"] = 0
+        assert isinstance(response.sectors, tuple)
+        with pytest.raises(AttributeError):
+            response.sectors[0].risk_score = 100.0
+        with pytest.raises(AttributeError):
+            response.sectors[0].explainability.shock_value = 1.0
+    
+    def test_scenario_cache_keeps_echoed_inputs(self, mock_engine):
+        """Equal-valued inputs of different types are cached separately."""
+        as_int = mock_engine.calculate_scenario(ScenarioInput(10, [Partner.US]))
+        as_float = mock_engine.calculate_scenario(ScenarioInput(10.0, [Partner.US]))
+        assert type(as_int.to_dict()["scenario"]["tariff_percent"]) is int
+        assert isinstance(as_float.to_dict()["scenario"]["tariff_percent"], float)
+    
     def test_baseline_zero_risk(self, mock_engine):
         """Baseline (tariff=0) should produce zero risk."""
         response = mock_engine.get_baseline()
@@ -537,8 +621,8 @@ class TestBaseline:
 class TestEdgeCases:
     """Test edge cases and error handling."""
     
-    def test_unknown_sector_ignored(self, mock_engine):
-        """Unknown sector IDs should be ignored."""
+    def test_unknown_sector_ignored(self, mock_engine, caplog):
+        """Unknown sector IDs should be ignored, with a warning."""
         scenario = ScenarioInput(
             tariff_percent=10,
             target_partners=[Partner.US],
@@ -549,6 +633,7 @@ class TestEdgeCases:
         # Should only return sector 87
         assert len(response.sectors) == 1
         assert response.sectors[0].sector_id == "87"
+        assert "Unknown sector_id: UNKNOWN, skipping" in caplog.text
     
     def test_empty_filter_returns_all(self, mock_engine):
         """Empty sector filter should return all sectors."""
@@ -0,0 +1,109 @@
+"""
+Risk Kernel Tests
+=================
+The compiled kernel and its NumPy fallback must agree exactly.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.risk_kernel import (
+    NUMBA_AVAILABLE,
+    risk_kernel,
+    rank_order,
+    round_array,
+    exposure_column,
+    build_exposure_table,
+    _risk_kernel_numpy,
+)
+from src.risk_engine import W_EXPOSURE, W_CONCENTRATION
+
+
+def _run(kernel, partner_cols, shock):
+    rng = np.random.default_rng(0)
+    shares = rng.dirichlet(np.ones(4), size=50)
+    concentration = rng.random(50)
+    total_exports = rng.random(50) * 1e10
+    rows = np.arange(0, 50, 3, dtype=np.intp)
+    out = np.empty((3, len(rows)))
+    kernel(
+        exposure_column(shares, partner_cols), concentration, total_exports, rows,
+        np.full(len(rows), shock), W_EXPOSURE, W_CONCENTRATION, out[0], out[1], out[2]
+    )
+    return out
+
+
+def test_kernel_matches_numpy_fallback():
+    """Compiled and fallback kernels should produce identical outputs."""
+    for partner_cols in ([], [0], [0, 2], [0, 1, 2, 3], [1, 1]):
+        for shock in (0.0, 0.4, 1.0):
+            np.testing.assert_array_equal(
+                _run(risk_kernel, partner_cols, shock),
+                _run(_risk_kernel_numpy, partner_cols, shock)
+            )
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+def test_kernel_compiled_at_import():
+    """The kernel is compiled eagerly, so no request pays JIT compilation."""
+    assert len(risk_kernel.signatures) == 1
+    # A lazily-compiling dispatcher would add a signature on the first call
+    _run(risk_kernel, [0], 0.4)
+    assert len(risk_kernel.signatures) == 1
+
+
+def test_kernel_clamps_exposure():
+    """Exposure must stay within [0, 1] even when shares are double-counted."""
+    exposure = _run(risk_kernel, [0, 1, 2, 3, 0, 1], 1.0)[0]
+    assert exposure.max() <= 1.0
+    assert exposure.min() >= 0.0
+
+
+def test_exposure_table_matches_ordered_sums():
+    """Every tabulated selection equals summing its shares in that order."""
+    shares = np.random.default_rng(1).dirichlet(np.ones(4), size=20)
+    table, index = build_exposure_table(shares)
+    
+    assert len(index) == 65  # ordered selections of 0-4 distinct partners
+    assert not table[index[()]].any()
+    for cols, row in index.items():
+        expected = [min(1.0, max(0.0, sum((s[c] for c in cols), 0.0))) for s in shares.tolist()]
+        assert table[row].tolist() == expected
+
+
+def test_round_array_matches_builtin_round():
+    """Vectorized rounding must agree with round(), including .5 boundaries."""
+    rng = np.random.default_rng(0)
+    values = np.concatenate([
+        rng.random(10000) * 100,
+        np.arange(-2000, 2000) / 1000 + 0.05,
+        np.arange(-2000, 2000) / 200,
+    ])
+    for ndigits in (1, 2):
+        expected = [round(v, ndigits) for v in values.tolist()]
+        assert round_array(values, ndigits).tolist() == expected
+
+
+def test_kernel_clamps_risk():
+    """Risk scores stay within [0, 100] for every kernel, even past a full shock."""
+    for kernel in (risk_kernel, _risk_kernel_numpy):
+        risk = _run(kernel, [0, 1, 2, 3], 5.0)[1]
+        assert risk.max() == 100.0
+        assert risk.min() >= 0.0
+
+
+def test_rank_order_top_k_matches_stable_sort():
+    """Partial top-k selection equals slicing a stable descending sort, ties included."""
+    rng = np.random.default_rng(2)
+    primary = rng.integers(0, 5, 40).astype(float)
+    secondary = rng.integers(0, 3, 40).astype(float)
+    by_primary = sorted(range(40), key=lambda i: -primary[i])
+    by_both = sorted(range(40), key=lambda i: (-primary[i], -secondary[i]))
+    for k in (None, 1, 5, 40):
+        assert rank_order(primary, k=k).tolist() == by_primary[:k]
+        assert rank_order(primary, secondary, k).tolist() == by_both[:k]
@@ -12,7 +12,8 @@ import sys
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.routes import create_app
+from src.routes import create_app, parse_partners, parse_partners_param, parse_sectors_param
+from src.schemas import Partner
 
 
 @pytest.fixture
@@ -104,6 +105,16 @@ class TestBaselineEndpoint:
         for sector in data['sectors']:
             assert sector['risk_score'] == 0.0
 
+    def test_baseline_sector_filter(self, client):
+        """Filtered baseline only returns the requested known sectors."""
+        first = client.get('/api/baseline?sectors=87, 72,XX')
+        second = client.get('/api/baseline?sectors=87, 72,XX')
+        data = json.loads(first.data)
+        assert first.status_code == 200
+        assert {s['sector_id'] for s in data['sectors']} == {'87', '72'}
+        assert data['scenario']['sector_filter'] == ['87', '72', 'XX']
+        assert first.data == second.data
+
 
 class TestScenarioEndpoint:
     """Test /api/scenario endpoint."""
@@ -151,6 +162,16 @@ class TestScenarioEndpoint:
         risks = [s['risk_score'] for s in data['sectors']]
         assert risks == sorted(risks, reverse=True)
         
+    def test_scenario_repeat_is_cached(self, client):
+        """Repeated scenarios are served from the response cache, unchanged."""
+        payload = {"tariff_percent": 12.5, "target_partners": ["EU", "US"], "sector_filter": ["87", "72"]}
+        first = client.post('/api/scenario', json=payload)
+        second = client.post('/api/scenario', json=payload)
+        assert first.data == second.data
+        data = json.loads(first.data)
+        assert data['scenario']['target_partners'] == ["EU", "US"]
+        assert data['scenario']['sector_filter'] == ["87", "72"]
+        
     def test_scenario_missing_tariff_percent(self, client):
         """Scenario rejects missing tariff_percent."""
         payload = {"target_partners": ["US"]}
@@ -252,6 +273,48 @@ class TestCompareEndpoint:
         # At least some sectors should have positive risk change
         assert any(s['risk_change'] > 0 for s in comparison)
 
+    def test_compare_matches_scenario_endpoint(self, client):
+        """Compare risks match the single-scenario results, sorted by risk_change."""
+        baseline = {"tariff_percent": 5, "target_partners": ["EU"]}
+        scenario = {"tariff_percent": 20, "target_partners": ["US", "China"]}
+        response = client.post('/api/compare', json={"baseline": baseline, "scenario": scenario})
+        comparison = json.loads(response.data)['comparison']
+        
+        base = json.loads(client.post('/api/scenario', json=baseline).data)
+        shock = json.loads(client.post('/api/scenario', json=scenario).data)
+        base_risk = {s['sector_id']: s['risk_score'] for s in base['sectors']}
+        shock_risk = {s['sector_id']: s['risk_score'] for s in shock['sectors']}
+        
+        assert len(comparison) == len(shock['sectors'])
+        for s in comparison:
+            assert s['baseline_risk'] == base_risk[s['sector_id']]
+            assert s['scenario_risk'] == shock_risk[s['sector_id']]
+        changes = [s['risk_change'] for s in comparison]
+        assert changes == sorted(changes, reverse=True)
+
+    def test_compare_unsorted_keeps_gainers(self, client):
+        """?sort=false skips the full sort but biggest_gainers stays the top 5."""
+        payload = {"scenario": {"tariff_percent": 25, "target_partners": ["US"]}}
+        ranked = json.loads(client.post('/api/compare', json=payload).data)
+        unsorted = json.loads(client.post('/api/compare?sort=false', json=payload).data)
+        
+        assert unsorted['biggest_gainers'] == ranked['comparison'][:5]
+        assert ranked['biggest_gainers'] == ranked['comparison'][:5]
+        key = lambda s: s['sector_id']
+        assert sorted(unsorted['comparison'], key=key) == sorted(ranked['comparison'], key=key)
+
+    def test_compare_columnar_format(self, client):
+        """Columnar comparison holds the same values as the per-sector records."""
+        payload = {"scenario": {"tariff_percent": 25, "target_partners": ["US", "EU"]}}
+        rows = json.loads(client.post('/api/compare', json=payload).data)['comparison']
+        columns = json.loads(
+            client.post('/api/compare?response_format=columnar', json=payload).data
+        )['comparison']
+        
+        assert set(columns) == set(rows[0])
+        for field, values in columns.items():
+            assert values == [r[field] for r in rows]
+
 
 class TestActualTariffsEndpoint:
     """Test /api/actual-tariffs endpoint."""
@@ -280,6 +343,15 @@ class TestActualTariffsEndpoint:
             # At least one steel sector should have non-zero risk
             assert any(s['risk_score'] > 0 for s in steel_sectors)
 
+    def test_actual_tariffs_cache_matches_engine(self, client):
+        """Precomputed unfiltered responses equal a live engine calculation."""
+        engine = client.application.config['RISK_ENGINE']
+        response = client.get('/api/actual-tariffs?partners=EU, US,EU')
+        expected = engine.calculate_actual_tariffs_on_canada(
+            target_partners=[Partner.US, Partner.EU]
+        ).to_dict()
+        assert json.loads(response.data) == json.loads(json.dumps(expected))
+
 
 class TestTariffRatesEndpoint:
     """Test /api/tariff-rates endpoint."""
@@ -373,3 +445,49 @@ class TestErrorHandling:
             content_type='application/json'
         )
         assert response.status_code == 400
+
+    def test_invalid_json_error_is_json(self, client):
+        """Malformed JSON bodies get a JSON error, as other 400s do."""
+        response = client.post('/api/compare', data='{"scenario":', content_type='application/json')
+        assert response.status_code == 400
+        assert 'error' in json.loads(response.data)
+
+
+class TestRequestParsing:
+    """Test the shared request parsing helpers."""
+    
+    def test_parse_partners(self):
+        """Body partners map to Partners; unknown IDs raise ValueError."""
+        assert parse_partners(["US", "EU"]) == [Partner.US, Partner.EU]
+        with pytest.raises(ValueError, match="Invalid partner: Other"):
+            parse_partners(["US", "Other"])
+    
+    def test_parse_query_params(self):
+        """Query params are stripped; partners are a set with a US default."""
+        assert parse_partners_param("China, XX ,EU") == [Partner.CHINA, Partner.EU]
+        assert parse_partners_param("XX") == [Partner.US]
+        assert parse_partners_param("EU,US, US") == [Partner.US, Partner.EU]
+        assert parse_sectors_param(" 87, 72") == ["87", "72"]
+        assert parse_sectors_param("") is None
+
+
+class TestStaticCaching:
+    """Test ETag handling on the static endpoints."""
+    
+    @pytest.mark.parametrize('path', [
+        '/api/sectors', '/api/partners', '/api/config', '/api/tariff-rates', '/api/baseline'
+    ])
+    def test_etag_revalidation(self, client, path):
+        """Static endpoints send a strong ETag and answer 304 when it matches."""
+        response = client.get(path)
+        etag = response.headers['ETag']
+        assert not etag.startswith('W/')
+        assert 'immutable' in response.headers['Cache-Control']
+        
+        cached = client.get(path, headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.data == b''
+        
+        stale = client.get(path, headers={'If-None-Match': '"stale"'})
+        assert stale.status_code == 200
+        assert stale.data == response.data
@@ -0,0 +1,56 @@
+"""
+Tariff Data Tests
+=================
+Tests for the tariff lookup tables and the dense tariff matrix.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tariff_data import (
+    TARIFF_PARTNERS,
+    US_TARIFFS_ON_CANADA,
+    build_tariff_matrix,
+    get_tariff_rate,
+    get_max_tariff_rate,
+    get_all_tariffed_sectors,
+)
+
+
+def test_matrix_aligned_with_sector_order():
+    """Each matrix row should hold the rates of the sector at that position."""
+    sector_ids = ["72", "01", "10", "47"]
+    matrix = build_tariff_matrix(sector_ids)
+
+    assert matrix.shape == (4, len(TARIFF_PARTNERS))
+    for row, sector_id in enumerate(sector_ids):
+        for col, partner in enumerate(TARIFF_PARTNERS):
+            assert matrix[row, col] == get_tariff_rate(sector_id, partner)
+
+
+def test_rate_lookups():
+    """Known rates, unpadded and integer codes, and unknown partners."""
+    assert get_tariff_rate("72", "US") == 25.0
+    assert get_tariff_rate("2", "China") == 25.0
+    assert get_tariff_rate(2, "China") == 25.0
+    assert get_tariff_rate("XX", "US") == 0.0
+    assert get_tariff_rate("72", "Other") == 0.0
+    assert get_tariff_rate("01", "US") == 0.0
+    assert get_max_tariff_rate("10") == 25.0
+    assert get_max_tariff_rate("01") == 0
+
+
+def test_all_tariffed_sectors_is_read_only():
+    """The shared table is returned as-is and cannot be mutated by callers."""
+    sectors = get_all_tariffed_sectors()
+    assert sectors is get_all_tariffed_sectors()
+    assert set(US_TARIFFS_ON_CANADA) <= set(sectors)
+    with pytest.raises(TypeError):
+        sectors["72"]["US"] = 0
+    with pytest.raises(TypeError):
+        sectors["01"] = {}
+    assert get_all_tariffed_sectors()["72"]["US"] == 25.0